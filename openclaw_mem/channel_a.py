@@ -17,6 +17,7 @@ from typing import Any
 
 from openclaw_mem.cli import DEFAULT_DB, _connect, _insert_observation, cmd_pack
 from openclaw_mem.context_pack_v1 import CONTEXT_PACK_V1_SCHEMA
+from openclaw_mem.core import jsonio
 
 
 PRODUCER_RECEIPT_SCHEMA = "openclaw-mem.channel-a.producer.receipt.v1"
@@ -31,7 +32,7 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
             if not line:
                 continue
             try:
-                row = json.loads(line)
+                row = jsonio.loads(line)
             except json.JSONDecodeError as exc:
                 raise ValueError(f"{path}:{line_no}: invalid JSON: {exc}") from exc
             if not isinstance(row, dict):
@@ -117,7 +118,7 @@ def build_pack(conn, *, query: str, limit: int, budget_tokens: int) -> dict[str,
     buf = io.StringIO()
     with redirect_stdout(buf):
         cmd_pack(conn, ns)
-    payload = json.loads(buf.getvalue() or "{}")
+    payload = jsonio.loads(buf.getvalue() or "{}")
     context_pack = payload.get("context_pack")
     if not isinstance(context_pack, dict) or context_pack.get("schema") != CONTEXT_PACK_V1_SCHEMA:
         raise RuntimeError("pack did not emit ContextPack v1")
@@ -12,6 +12,7 @@ from __future__ import annotations
 import argparse
 import fnmatch
 import hashlib
+import heapq
 import io
 import importlib.util
 import json
@@ -31,12 +32,13 @@ import urllib.error
 import urllib.request
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, redirect_stdout
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Callable, Dict, Any, List, Mapping, Optional, Set, Tuple
+from typing import Iterable, Iterator, Callable, Dict, Any, List, Mapping, Optional, Set, Tuple
 
 from openclaw_mem import __version__
 from openclaw_mem import defaults
@@ -62,6 +64,7 @@ from openclaw_mem import project_resolver
 from openclaw_mem.core import episodes as core_episodes
 from openclaw_mem.core import config as core_config
 from openclaw_mem.core import harness_install as core_harness_install
+from openclaw_mem.core import jsonio
 from openclaw_mem.core.embeddings import (
     EmbeddingProviderError,
     MissingEmbeddingCredentials,
@@ -106,7 +109,7 @@ from openclaw_mem.docs_memory import (
     parse_ts_hint,
     rrf_components,
 )
-from openclaw_mem.vector import l2_norm, pack_f32, rank_cosine, rank_rrf
+from openclaw_mem.vector import pack_f32_with_norm, rank_cosine, rank_rrf
 from openclaw_mem.optimization import (
     _recent_use_from_lifecycle,
     build_consolidation_review,
@@ -1599,6 +1602,7 @@ from openclaw_mem.core.db import (  # noqa: E402
     CURRENT_DB_VERSION as CURRENT_DB_VERSION,
     MIGRATIONS as MIGRATIONS,
     Migration as Migration,
+    _close_connection as _close_connection,
     _connect as _connect,
     _enable_wal_best_effort as _enable_wal_best_effort,
     _init_db as _init_db,
@@ -1626,7 +1630,7 @@ def _iter_jsonl(fp) -> Iterable[Dict[str, Any]]:
         line = line.strip()
         if not line:
             continue
-        yield json.loads(line)
+        yield jsonio.loads(line)
 
 
 def _path_health(path_str: str) -> Dict[str, Any]:
@@ -2298,7 +2302,12 @@ def cmd_profile(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     tool_limit = max(1, min(200, int(getattr(args, "tool_limit", 10) or 10)))
     kind_limit = max(1, min(200, int(getattr(args, "kind_limit", 10) or 10)))
 
-    row = conn.execute("SELECT COUNT(*) AS n, MIN(ts) AS min_ts, MAX(ts) AS max_ts FROM observations").fetchone()
+    # One scan for the totals, the ts range and summary_en coverage.
+    row = conn.execute(
+        "SELECT COUNT(*) AS n, MIN(ts) AS min_ts, MAX(ts) AS max_ts, "
+        "SUM(CASE WHEN COALESCE(summary_en, '') <> '' THEN 1 ELSE 0 END) AS summary_en_present "
+        "FROM observations"
+    ).fetchone()
 
     kinds = conn.execute(
         """
@@ -2356,7 +2365,7 @@ def cmd_profile(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     for r in conn.execute("SELECT detail_json FROM observations"):
         raw = r["detail_json"]
         try:
-            detail_obj = json.loads(raw or "{}")
+            detail_obj = jsonio.loads(raw or "{}")
         except Exception:
             label_counts["unknown"] += 1
             continue
@@ -2386,13 +2395,8 @@ def cmd_profile(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
             "FROM observations GROUP BY 1 ORDER BY 1"
         ).fetchall()
     }
-    coverage = conn.execute(
-        "SELECT COUNT(*) AS total, "
-        "SUM(CASE WHEN COALESCE(summary_en, '') <> '' THEN 1 ELSE 0 END) AS present "
-        "FROM observations"
-    ).fetchone()
-    coverage_total = int(coverage["total"] or 0)
-    coverage_present = int(coverage["present"] or 0)
+    coverage_total = total_count
+    coverage_present = int(row["summary_en_present"] or 0)
     summary_en_coverage = {
         "present": coverage_present,
         "total": coverage_total,
@@ -5995,6 +5999,7 @@ def cmd_ingest(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
             conn,
             _iter_jsonl(fp),
             importance_scorer=getattr(args, "importance_scorer", None),
+            bulk=bool(getattr(args, "bulk", False)),
         )
     finally:
         if args.file:
@@ -6237,7 +6242,7 @@ def _invoke_cli_json(conn: sqlite3.Connection, argv: List[str]) -> Dict[str, Any
             exit_code = int(exc.code) if isinstance(exc.code, int) else 1
     raw = output.getvalue().strip()
     try:
-        payload = json.loads(raw)
+        payload = jsonio.loads(raw)
     except json.JSONDecodeError:
         return {
             "kind": "openclaw-mem.curate.inner-error.v1",
@@ -6977,7 +6982,7 @@ def cmd_docs_ingest(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
                             (chunk_rowid, model, dim, vector, norm, text_hash, created_at)
                             VALUES (?, ?, ?, ?, ?, ?, ?)
                             """,
-                            (rowid, model, len(vec), pack_f32(vec), l2_norm(vec), text_hash, now),
+                            (rowid, model, len(vec), *pack_f32_with_norm(vec), text_hash, now),
                         )
                         stats["embedded"] = int(stats["embedded"]) + 1
             except Exception as e:
@@ -7139,12 +7144,8 @@ def _docs_vec_rows(
     return out
 
 
-def cmd_docs_search(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
-    query = (getattr(args, "query", "") or "").strip()
-    if not query:
-        _emit({"error": "empty query"}, True)
-        sys.exit(2)
-
+def _docs_search_payload(conn: sqlite3.Connection, args: argparse.Namespace, query: str) -> Dict[str, Any]:
+    """Run a hybrid docs search and return the `docs search --json` payload."""
     limit = max(1, int(getattr(args, "limit", 10) or 10))
     fts_k = max(limit, int(getattr(args, "fts_k", limit * 2) or (limit * 2)))
     vec_k = max(limit, int(getattr(args, "vec_k", limit * 2) or (limit * 2)))
@@ -7191,6 +7192,8 @@ def cmd_docs_search(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
 
     selected_ids = [rid for rid, _ in fused[:limit]]
     selected_map = {rid: fused_map[rid] for rid in selected_ids if rid in fused_map}
+    fts_id_set = set(fts_ids)
+    vec_id_set = set(vec_ids)
 
     final: List[Dict[str, Any]] = []
     for rid, rrf_score in fused[:limit]:
@@ -7205,9 +7208,9 @@ def cmd_docs_search(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
         )
         row["rrf_score"] = float(rrf_score)
         row["match"] = []
-        if rid in fts_ids:
+        if rid in fts_id_set:
             row["match"].append("fts")
-        if rid in vec_ids:
+        if rid in vec_id_set:
             row["match"].append("vector")
         final.append(row)
 
@@ -7280,43 +7283,74 @@ def cmd_docs_search(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     if vec_error:
         payload["vector_status"] = vec_error
 
+    return payload
+
+
+def cmd_docs_search(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
+    query = (getattr(args, "query", "") or "").strip()
+    if not query:
+        _emit({"error": "empty query"}, True)
+        sys.exit(2)
+
+    payload = _docs_search_payload(conn, args, query)
     if args.json:
         _emit(payload, True)
         return
 
-    for item in final:
+    for item in payload["results"]:
         text = str(item.get("text") or "").replace("\n", " ").strip()
         if len(text) > 140:
             text = text[:137] + "…"
         print(f"{item['recordRef']} :: {text}")
 
 
+# Text output only renders what `_print_row` prints, so non-JSON reads skip
+# the remaining columns (notably detail_json) at the SQLite boundary.
+_PRINT_ROW_COLUMNS = "id, ts, kind, tool_name, summary"
+
+
 def cmd_get(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     ids = args.ids
+    columns = "*" if args.json else _PRINT_ROW_COLUMNS
+    # One statement shape for any number of ids keeps the prepared-statement
+    # cache warm instead of planning a fresh IN (?, ?, ...) per id count.
     rows = conn.execute(
-        f"SELECT * FROM observations WHERE id IN ({','.join(['?']*len(ids))}) ORDER BY id",
-        ids,
+        f"SELECT {columns} FROM observations WHERE id IN (SELECT value FROM json_each(?)) ORDER BY id",
+        (json.dumps([int(id_) for id_ in ids]),),
     ).fetchall()
     _emit([dict(r) for r in rows], args.json)
 
 
+# Timeline rows are a preview; `get` (or `timeline --detail`) returns the
+# potentially large detail_json payload.
+_TIMELINE_COLUMNS = "id, ts, kind, summary, summary_en, lang, tool_name"
+
+
 def cmd_timeline(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     window = args.window
-    seen = set()
-    out = []
-    for id_ in args.ids:
-        lo, hi = id_ - window, id_ + window
-        rows = conn.execute(
-            "SELECT * FROM observations WHERE id BETWEEN ? AND ? ORDER BY id",
-            (lo, hi),
-        ).fetchall()
-        for r in rows:
-            if r["id"] in seen:
-                continue
-            seen.add(r["id"])
-            out.append(dict(r))
-    out.sort(key=lambda x: x["id"])
-    _emit(out, args.json)
+    if not args.json:
+        columns = _PRINT_ROW_COLUMNS
+    elif getattr(args, "detail", False):
+        columns = f"{_TIMELINE_COLUMNS}, detail_json"
+    else:
+        columns = _TIMELINE_COLUMNS
+    # One statement for all windows: the anchor ids arrive as a JSON array,
+    # each drives a rowid range scan, and the IN list dedupes overlapping
+    # windows while yielding rows in id order.
+    rows = conn.execute(
+        f"""
+        SELECT {columns}
+        FROM observations
+        WHERE id IN (
+            SELECT o.id
+            FROM json_each(?) AS j
+            JOIN observations AS o ON o.id BETWEEN j.value - ? AND j.value + ?
+        )
+        ORDER BY id
+        """,
+        (json.dumps([int(id_) for id_ in args.ids]), window, window),
+    ).fetchall()
+    _emit([dict(r) for r in rows], args.json)
 
 
 _DEFAULT_ERROR_HINT = (
@@ -8125,8 +8159,7 @@ def cmd_embed(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
 
             vecs = client.embed(texts, model=model)
             for tid, vec in zip(chunk_ids, vecs):
-                blob = pack_f32(vec)
-                norm = l2_norm(vec)
+                blob, norm = pack_f32_with_norm(vec)
                 dim = len(vec)
                 conn.execute(
                     f"""
@@ -11785,37 +11818,63 @@ def _tokenize_query(q: str) -> List[str]:
     return toks[:20]
 
 
-def _rank_obs_ids_from_snippet(snippet: str, query: str, base_score: float = 0.0) -> List[tuple[int, float]]:
+_OBS_REF_RE = re.compile(r"\bobs#(\d+)\b")
+
+
+def _iter_obs_lines(snippet: str) -> Iterator[Tuple[int, str]]:
+    """Yield ``(obs_id, line)`` for each snippet line carrying an ``obs#N`` ref.
+
+    Lines are split exactly as ``str.splitlines()`` does (a bare CR, form
+    feed, NEL or U+2028 all end a line) and only the first ref on a line
+    counts. Snippets without the marker are rejected with one substring check,
+    and lines without it never reach the regex.
+    """
+    if "obs#" not in snippet:
+        return
+    search = _OBS_REF_RE.search
+    for line in snippet.splitlines():
+        if "obs#" not in line:
+            continue
+        m = search(line)
+        if m is not None:
+            yield int(m.group(1)), line
+
+
+def _rank_obs_ids_from_snippet(
+    snippet: str,
+    query: str,
+    base_score: float = 0.0,
+    *,
+    tokens: Optional[List[str]] = None,
+    query_lower: Optional[str] = None,
+    ordered: bool = True,
+) -> List[tuple[int, float]]:
     """Heuristically map a memory_search snippet back to obs IDs.
 
     memory_search returns chunk-level matches; a snippet may contain multiple obs lines.
     We score each obs line by simple token overlap with the query.
-    """
-    import re
 
-    toks = _tokenize_query(query)
+    Callers ranking many snippets for one query can pass the precomputed
+    `tokens` / `query_lower` so the query is only normalized once, and
+    `ordered=False` when they merge and rank across snippets themselves.
+    """
     if not snippet:
         return []
+    toks = tokens if tokens is not None else _tokenize_query(query)
+    q_lower = query_lower if query_lower is not None else (query or "").lower()
 
     ranked: List[tuple[int, float]] = []
-    for line in str(snippet).splitlines():
-        m = re.search(r"\bobs#(\d+)\b", line)
-        if not m:
-            continue
-        try:
-            oid = int(m.group(1))
-        except Exception:
-            continue
-
+    for oid, line in _iter_obs_lines(str(snippet)):
         line_l = line.lower()
         overlap = sum(1 for t in toks if t in line_l)
         # Strongly prefer exact obs# queries
-        exact = 5 if f"obs#{oid}" in (query or "").lower() else 0
+        exact = 5 if f"obs#{oid}" in q_lower else 0
         score = overlap + exact + (base_score * 2.0)
         ranked.append((oid, float(score)))
 
-    # Highest score first
-    ranked.sort(key=lambda x: (-x[1], x[0]))
+    if ordered:
+        # Highest score first
+        ranked.sort(key=lambda x: (-x[1], x[0]))
     return ranked
 
 
@@ -11860,38 +11919,57 @@ def cmd_semantic(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
         _emit({"error": f"unexpected memory_search result shape: {type(result).__name__}"}, args.json)
         sys.exit(1)
 
+    query_tokens = _tokenize_query(query)
+    query_lower = query.lower()
     scores: Dict[int, float] = {}
+    scores_get = scores.get
     for r in results:
         if not isinstance(r, dict):
             continue
         snippet = str(r.get("snippet") or "")
         base = float(r.get("score") or 0.0)
-        for oid, sc in _rank_obs_ids_from_snippet(snippet, query, base_score=base):
-            scores[oid] = max(scores.get(oid, 0.0), sc)
+        for oid, sc in _rank_obs_ids_from_snippet(
+            snippet, query, base_score=base, tokens=query_tokens, query_lower=query_lower, ordered=False
+        ):
+            # Keep the best score per id (floored at 0.0) with one lookup.
+            cur = scores_get(oid)
+            if cur is None:
+                scores[oid] = sc if sc > 0.0 else 0.0
+            elif sc > cur:
+                scores[oid] = sc
 
     if not scores:
         _emit({"ok": True, "query": query, "matches": [], "raw": results[: int(args.raw_limit)]}, args.json)
         return
 
-    ids_ranked = [oid for oid, _ in sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))]
+    # Only the top `limit` ids are reported, so rank once across all snippets
+    # and resolve just those rows.
+    ids_ranked = [oid for oid, _ in heapq.nsmallest(int(args.limit), scores.items(), key=lambda kv: (-kv[1], kv[0]))]
 
-    # Resolve observations
-    q = f"SELECT id, ts, kind, tool_name, summary FROM observations WHERE id IN ({','.join(['?']*len(ids_ranked))})"
-    rows = conn.execute(q, ids_ranked).fetchall()
-    obs_map = {int(r["id"]): dict(r) for r in rows}
+    # Resolve observations. The id list is bound as one JSON array so the SQL
+    # text stays constant (statement-cache hit) whatever the number of ids.
+    rows = conn.execute(
+        """
+        SELECT o.id, o.ts, o.kind, o.tool_name, o.summary
+        FROM json_each(?) AS j
+        JOIN observations AS o ON o.id = j.value
+        """,
+        (json.dumps(ids_ranked),),
+    ).fetchall()
+    obs_map = {int(r["id"]): r for r in rows}
 
     out = []
-    for oid in ids_ranked[: int(args.limit)]:
+    for oid in ids_ranked:
         r = obs_map.get(oid)
-        if not r:
+        if r is None:
             continue
-        out.append(r)
+        out.append(dict(r))
 
     _emit(
         {
             "ok": True,
             "query": query,
-            "ids": ids_ranked[: int(args.limit)],
+            "ids": ids_ranked,
             "matches": out,
             "raw": results[: int(args.raw_limit)],
         },
@@ -11899,12 +11977,14 @@ def cmd_semantic(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     )
 
 
-def _triage_observations(conn: sqlite3.Connection, since_ts: str, keywords: List[str], limit: int) -> List[Dict[str, Any]]:
+def _triage_observations(conn: sqlite3.Connection, since_ts: str, keywords: List[str], limit: int) -> List[sqlite3.Row]:
     clauses: List[str] = []
     params: List[Any] = [since_ts]
     for k in keywords:
         like = f"%{k}%"
-        clauses.append("(lower(coalesce(summary,'')) LIKE ? OR lower(coalesce(tool_name,'')) LIKE ? OR lower(coalesce(detail_json,'')) LIKE ?)")
+        # LIKE already folds ASCII case (the same folding lower() applies) and
+        # NULL columns simply fail to match, so no per-row string rewrites.
+        clauses.append("(summary LIKE ? OR tool_name LIKE ? OR detail_json LIKE ?)")
         params.extend([like, like, like])
 
     where_kw = " OR ".join(clauses) if clauses else "1=0"
@@ -11916,8 +11996,8 @@ def _triage_observations(conn: sqlite3.Connection, since_ts: str, keywords: List
         LIMIT ?
     """
     params.append(limit)
-    rows = conn.execute(q, params).fetchall()
-    return [dict(r) for r in rows]
+    # Rows stay as sqlite3.Row; cmd_triage copies only the matches it reports.
+    return conn.execute(q, params).fetchall()
 
 
 
@@ -11933,11 +12013,8 @@ def _triage_cron_errors(*, since_ms: int, cron_jobs_path: str, limit: int) -> Li
     """
 
     p = Path(os.path.expanduser(cron_jobs_path))
-    if not p.exists():
-        return []
-
     try:
-        data = json.loads(p.read_text("utf-8"))
+        data = jsonio.loads(p.read_bytes())
     except Exception:
         return []
 
@@ -11989,19 +12066,25 @@ def _triage_cron_errors(*, since_ms: int, cron_jobs_path: str, limit: int) -> Li
             return line[: max_chars - 1] + "…"
         return line
 
+    cutoff_ms = int(since_ms)
     bad: List[Dict[str, Any]] = []
     for j in jobs:
         if not isinstance(j, dict):
             continue
-        state = j.get("state") if isinstance(j.get("state"), dict) else {}
-
+        # Cheapest rejections first: most jobs are healthy, so bail out on
+        # lastStatus before coercing any timestamps.
+        state = j.get("state")
+        if not isinstance(state, dict):
+            continue
         last_status_raw = state.get("lastStatus")
-        last_status = (str(last_status_raw).strip() if last_status_raw is not None else None)
+        if last_status_raw is None:
+            continue
+        last_status = str(last_status_raw).strip()
+        if last_status.lower() == "ok":
+            continue
 
         last_run = _as_int(state.get("lastRunAtMs"))
-        if last_status is None or last_status.lower() == "ok":
-            continue
-        if last_run is not None and int(last_run) < int(since_ms):
+        if last_run is not None and last_run < cutoff_ms:
             continue
 
         bad.append(
@@ -12022,8 +12105,7 @@ def _triage_cron_errors(*, since_ms: int, cron_jobs_path: str, limit: int) -> Li
             }
         )
 
-    bad.sort(key=lambda x: (-(int(x.get("lastRunAtMs") or 0)), str(x.get("name") or "")))
-    return bad[:limit]
+    return heapq.nsmallest(limit, bad, key=lambda x: (-(x["lastRunAtMs"] or 0), str(x["name"] or "")))
 
 
 
@@ -12049,11 +12131,24 @@ def _triage_tasks(conn: sqlite3.Connection, *, since_ts: str, importance_min: fl
       between wrappers and the next wrapper/marker;
       accepts ':', whitespace, ';', '；', '-', '－', '–', '—', '−', or marker-only)
 
-    Importance is best-effort parsed from detail_json.importance.
+    Importance is best-effort parsed from detail_json.importance. Only that
+    field is extracted (SQL-side via json_extract); the full detail_json blob
+    is decoded in Python only when SQLite's json_valid rejects it or the
+    "importance" key appears more than once. On SQLite 3.42-3.44, json_valid
+    also accepts JSON5, so such rows are scored from SQLite's reading where
+    `json.loads` would reject them (scoring 0.0).
     """
     rows = conn.execute(
         """
-        SELECT id, ts, kind, tool_name, summary, detail_json
+        SELECT id, ts, kind, tool_name, summary,
+               json_extract(CASE WHEN json_valid(detail_json) THEN detail_json ELSE '{}' END, '$.importance') AS importance_raw,
+               json_type(CASE WHEN json_valid(detail_json) THEN detail_json ELSE '{}' END, '$.importance') AS importance_type,
+               CASE
+                   WHEN json_valid(detail_json)
+                        AND instr(substr(detail_json, instr(detail_json, '"importance"') + 1), '"importance"') = 0
+                   THEN NULL
+                   ELSE detail_json
+               END AS detail_json_fallback
         FROM observations
         WHERE ts >= ? AND tool_name = 'memory_store'
         ORDER BY id DESC
@@ -12073,12 +12168,22 @@ def _triage_tasks(conn: sqlite3.Connection, *, since_ts: str, importance_min: fl
         if not is_task:
             continue
 
-        imp = 0.0
+        imp_raw = r["importance_raw"]
+        imp_type = r["importance_type"]
         try:
-            dj = json.loads(r["detail_json"] or "{}")
-            from openclaw_mem.importance import parse_importance_score
-
-            imp = parse_importance_score(dj.get("importance"))
+            if r["detail_json_fallback"] is not None:
+                # SQLite rejects some payloads Python's json accepts (NaN,
+                # Infinity), and with a repeated key json_extract takes the
+                # first value where json.loads keeps the last; decode those
+                # rows in Python as before.
+                imp_raw = json.loads(r["detail_json_fallback"]).get("importance")
+            elif imp_type == "object":
+                # json_extract hands objects back as JSON text; decode only that fragment.
+                imp_raw = json.loads(imp_raw)
+            elif imp_type in ("true", "false"):
+                # json_extract turns JSON booleans into 1/0; keep them booleans.
+                imp_raw = imp_type == "true"
+            imp = parse_importance_score(imp_raw)
         except Exception:
             imp = 0.0
 
@@ -12093,10 +12198,10 @@ def _triage_tasks(conn: sqlite3.Connection, *, since_ts: str, importance_min: fl
 
 
 def _load_triage_state(path_: Path) -> Dict[str, Any]:
+    # A missing file is the common first-run case; let the read itself report
+    # it instead of paying for a separate exists() stat.
     try:
-        if not path_.exists():
-            return {}
-        return json.loads(path_.read_text("utf-8"))
+        return jsonio.loads(path_.read_bytes())
     except Exception:
         return {}
 
@@ -12353,7 +12458,7 @@ def cmd_skill_curator_lint(conn: sqlite3.Connection, args: argparse.Namespace) -
     del conn
     receipt = lint_skill_tree(
         getattr(args, "skill_root", "skills"),
-        command_schema=command_schema_from_parser(build_parser()),
+        command_schema=command_schema_from_parser(_invoke_parser()),
         max_lines=int(getattr(args, "max_lines", 60)),
     )
     if bool(getattr(args, "json", False)):
@@ -12454,7 +12559,7 @@ def cmd_service_recall(conn: sqlite3.Connection, args: argparse.Namespace) -> No
     buf = io.StringIO()
     with redirect_stdout(buf):
         cmd_pack(conn, ns)
-    pack_payload = json.loads(buf.getvalue())
+    pack_payload = jsonio.loads(buf.getvalue())
     _emit(
         {
             "schema": "openclaw-mem.service.recall.v0",
@@ -12555,7 +12660,7 @@ def _bridge_search_hits(conn: sqlite3.Connection, query: str, limit: int) -> Lis
     with redirect_stdout(buf):
         cmd_search(conn, ns)
     try:
-        rows = json.loads(buf.getvalue() or "[]")
+        rows = jsonio.loads(buf.getvalue() or "[]")
     except json.JSONDecodeError:
         rows = []
     if not isinstance(rows, list):
@@ -13341,7 +13446,7 @@ def cmd_triage(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
             "db locked",
         ]
 
-    cron_jobs_path = getattr(args, "cron_jobs_path", None) or "~/.openclaw/cron/jobs.json"
+    cron_jobs_path = os.path.expanduser(str(getattr(args, "cron_jobs_path", None) or "~/.openclaw/cron/jobs.json"))
 
     # Tasks scan is typically longer-lived than a 30m error window.
     tasks_since_minutes = int(getattr(args, "tasks_since_minutes", 24 * 60))
@@ -13354,35 +13459,41 @@ def cmd_triage(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
     last_task_id = int(((state.get("tasks") or {}).get("last_alerted_id") or 0))
     last_cron_ms = int(((state.get("cron") or {}).get("last_alerted_bad_run_at_ms") or 0))
 
-    from datetime import timezone
-
-    since_dt = datetime.now(timezone.utc) - timedelta(minutes=since_minutes)
-    since_utc = since_dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    now_dt = datetime.now(timezone.utc)
+    since_dt = now_dt - timedelta(minutes=since_minutes)
+    since_utc = since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
     since_ms = int(since_dt.timestamp() * 1000)
 
-    tasks_since_dt = datetime.now(timezone.utc) - timedelta(minutes=max(0, tasks_since_minutes))
-    tasks_since_utc = tasks_since_dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    tasks_since_dt = now_dt - timedelta(minutes=max(0, tasks_since_minutes))
+    tasks_since_utc = tasks_since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    obs_all: List[Dict[str, Any]] = []
+    obs_all: List[sqlite3.Row] = []
     cron_all: List[Dict[str, Any]] = []
     tasks_all: List[Dict[str, Any]] = []
 
-    if mode in {"heartbeat", "observations"}:
+    if mode == "heartbeat":
+        # The cron scan only touches its own JSON file, so overlap its read/parse
+        # with the two SQLite stages. Those stay on this thread: the connection
+        # is not shared across threads.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            cron_future = pool.submit(_triage_cron_errors, since_ms=since_ms, cron_jobs_path=cron_jobs_path, limit=limit)
+            obs_all = _triage_observations(conn, since_utc, keywords, limit)
+            tasks_all = _triage_tasks(conn, since_ts=tasks_since_utc, importance_min=importance_min, limit=limit)
+            cron_all = cron_future.result()
+    elif mode == "observations":
         obs_all = _triage_observations(conn, since_utc, keywords, limit)
-
-    if mode in {"heartbeat", "cron-errors"}:
-        cron_all = _triage_cron_errors(since_ms=since_ms, cron_jobs_path=str(cron_jobs_path), limit=limit)
-
-    if mode in {"heartbeat", "tasks"}:
+    elif mode == "cron-errors":
+        cron_all = _triage_cron_errors(since_ms=since_ms, cron_jobs_path=cron_jobs_path, limit=limit)
+    elif mode == "tasks":
         tasks_all = _triage_tasks(conn, since_ts=tasks_since_utc, importance_min=importance_min, limit=limit)
 
     if dedupe:
         # Dedupe: only alert on *new* items
-        obs_new = [m for m in obs_all if int(m.get("id") or 0) > last_obs_id]
+        obs_new = [dict(m) for m in obs_all if int(m["id"] or 0) > last_obs_id]
         tasks_new = [m for m in tasks_all if int(m.get("id") or 0) > last_task_id]
         cron_new = [m for m in cron_all if int(m.get("lastRunAtMs") or 0) > last_cron_ms]
     else:
-        obs_new = list(obs_all)
+        obs_new = [dict(m) for m in obs_all]
         tasks_new = list(tasks_all)
         cron_new = list(cron_all)
 
@@ -13398,7 +13509,7 @@ def cmd_triage(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
         "since_minutes": since_minutes,
         "since_utc": since_utc,
         "keywords": keywords,
-        "cron_jobs_path": os.path.expanduser(str(cron_jobs_path)),
+        "cron_jobs_path": cron_jobs_path,
         "tasks_since_minutes": tasks_since_minutes,
         "tasks_since_utc": tasks_since_utc,
         "importance_min": importance_min,
@@ -20678,7 +20789,76 @@ class _HelpAllAction(argparse.Action):
         parser.exit()
 
 
-def build_parser() -> argparse.ArgumentParser:
+class _DeferredParser:
+    """Stand-in for a subcommand parser that the current argv cannot select.
+
+    It accepts and discards the builder calls ``build_parser`` makes, so a
+    one-shot ``main()`` only allocates actions for the command it will run.
+    """
+
+    def add_argument(self, *args: Any, **kwargs: Any) -> None:
+        del args, kwargs
+
+    def set_defaults(self, **kwargs: Any) -> None:
+        del kwargs
+
+    def add_mutually_exclusive_group(self, **kwargs: Any) -> "_DeferredParser":
+        del kwargs
+        return self
+
+    def add_argument_group(self, *args: Any, **kwargs: Any) -> "_DeferredParser":
+        del args, kwargs
+        return self
+
+    def add_subparsers(self, **kwargs: Any) -> "_DeferredParser":
+        del kwargs
+        return self
+
+    def add_parser(self, name: str, **kwargs: Any) -> "_DeferredParser":
+        del name, kwargs
+        return self
+
+
+class _SelectiveSubParsersAction(argparse._SubParsersAction):
+    """Top-level subparsers action that only builds the selected commands.
+
+    Every command name and help row is still registered, so usage, choice
+    errors, and ``--help-all`` stay byte-compatible with the full parser.
+    """
+
+    def __init__(self, *args: Any, only: Optional[frozenset] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._openclaw_only = only
+
+    def add_parser(self, name: str, **kwargs: Any) -> Any:
+        only = self._openclaw_only
+        aliases = tuple(kwargs.get("aliases", ()))
+        if only is None or name in only or any(alias in only for alias in aliases):
+            return super().add_parser(name, **kwargs)
+        if "help" in kwargs:
+            self._choices_actions.append(self._ChoicesPseudoAction(name, aliases, kwargs["help"]))
+        parser = _DeferredParser()
+        for choice in (name, *aliases):
+            self._name_parser_map[choice] = parser
+        return parser
+
+
+def _reachable_commands(argv: List[str]) -> Optional[frozenset]:
+    """Return the tokens that may name the top-level command, or None for a full build."""
+
+    if any(token in {"-h", "--help", "--help-all"} for token in argv):
+        return None
+    candidates = frozenset(token for token in argv if token and not token.startswith("-"))
+    return candidates or None
+
+
+def build_parser(only: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    ``only`` restricts full construction to the named top-level commands; the
+    rest are registered by name so parsing and errors behave the same.
+    """
+
     resolved_config = core_config.resolve_config()
     configured_scope = str(resolved_config["default_scope"] or "") or None
     configured_vector_backend = str(resolved_config["vector_backend"])
@@ -20786,7 +20966,12 @@ def build_parser() -> argparse.ArgumentParser:
         sp.add_argument("--json", action="store_true", default=argparse.SUPPRESS, help="Structured JSON output")
         sp.add_argument("--harness-home", default=argparse.SUPPRESS, help="Agent Harness home for explicit env/db bridge")
 
-    sub = p.add_subparsers(dest="cmd", required=True)
+    sub = p.add_subparsers(
+        dest="cmd",
+        required=True,
+        action=_SelectiveSubParsersAction,
+        only=None if only is None else frozenset(only),
+    )
 
     sp = sub.add_parser("status", help="Show compact store/runtime status")
     add_common(sp)
@@ -21408,6 +21593,11 @@ def build_parser() -> argparse.ArgumentParser:
             "Use 'heuristic-v1' to enable, or 'off' to disable."
         ),
     )
+    sp.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Skip per-batch FTS indexing and rebuild the FTS index once at the end (large loads)",
+    )
     sp.set_defaults(func=cmd_ingest)
 
     sp = sub.add_parser("search", help="FTS search over observations")
@@ -21580,6 +21770,7 @@ def build_parser() -> argparse.ArgumentParser:
     add_common(sp)
     sp.add_argument("ids", type=int, nargs="+", help="Observation IDs")
     sp.add_argument("--window", type=int, default=4, help="±N rows around each id")
+    sp.add_argument("--detail", action="store_true", help="Include detail_json in each row")
     sp.set_defaults(func=cmd_timeline)
 
     sp = sub.add_parser("get", help="Get full observations by ID")
@@ -23084,7 +23275,7 @@ def _run_handler_with_deprecation(conn: sqlite3.Connection, args: argparse.Names
 
 
 def main() -> None:
-    args = build_parser().parse_args()
+    args = build_parser(only=_reachable_commands(sys.argv[1:])).parse_args()
     bridge_receipt = _apply_harness_env_bridge(args)
     if not hasattr(args, "harness_env_bridge"):
         args.harness_env_bridge = bridge_receipt
@@ -23111,14 +23302,17 @@ def main() -> None:
             conn.close()
         return
 
-    # Merge global flags (before subcommand) + per-command flags (after subcommand)
-    base_db = core_config.resolve_config()["db_path"]
-    args.db = getattr(args, "db", None) or getattr(args, "db_global", None) or base_db
+    # Merge global flags (before subcommand) + per-command flags (after subcommand).
+    # The config file is only consulted when neither flag names a DB.
+    args.db = getattr(args, "db", None) or getattr(args, "db_global", None) or core_config.resolve_config()["db_path"]
     args.json = bool(getattr(args, "json", False) or getattr(args, "json_global", False))
     args.db_preexisted = True if str(args.db) == ":memory:" else Path(str(args.db)).expanduser().exists()
 
     conn = _connect(args.db)
-    _run_handler_with_deprecation(conn, args)
+    try:
+        _run_handler_with_deprecation(conn, args)
+    finally:
+        _close_connection(conn)
 
 
 if __name__ == "__main__":
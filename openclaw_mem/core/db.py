@@ -21,6 +21,8 @@ _SURROGATE_MAX = 0xDFFF
 EPISODIC_SEARCH_TEXT_MAX_CHARS = 2400
 _SQLITE_CACHE_KIB = 64 * 1024
 _SQLITE_MMAP_BYTES = 256 * 1024 * 1024
+_SQLITE_SYNC_LEVELS = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+_DEFAULT_WAL_AUTOCHECKPOINT = 10000
 
 
 def _resolve_state_dir() -> str:
@@ -66,6 +68,7 @@ def _tune_read_performance(conn: sqlite3.Connection) -> None:
     """Apply connection-local read tuning without changing the database file."""
 
     conn.execute(f"PRAGMA cache_size=-{_SQLITE_CACHE_KIB};")
+    conn.execute("PRAGMA temp_store=MEMORY;")
     try:
         conn.execute(f"PRAGMA mmap_size={_SQLITE_MMAP_BYTES};")
     except sqlite3.OperationalError:
@@ -73,6 +76,52 @@ def _tune_read_performance(conn: sqlite3.Connection) -> None:
         pass
 
 
+def _wal_autocheckpoint_pages() -> int:
+    raw = str(os.getenv("OPENCLAW_MEM_WAL_AUTOCHECKPOINT") or "").strip()
+    try:
+        pages = int(raw)
+    except ValueError:
+        return _DEFAULT_WAL_AUTOCHECKPOINT
+    return pages if pages >= 0 else _DEFAULT_WAL_AUTOCHECKPOINT
+
+
+def _tune_write_durability(conn: sqlite3.Connection) -> None:
+    """Use WAL-safe ``synchronous=NORMAL`` unless OPENCLAW_MEM_SYNC overrides it.
+
+    In WAL mode NORMAL only drops the fsync per commit; a power loss can lose
+    the last transactions but never corrupts the file. Other journal modes
+    keep SQLite's default. Set OPENCLAW_MEM_SYNC=FULL for durability-critical
+    deployments.
+
+    WAL connections also checkpoint every ``OPENCLAW_MEM_WAL_AUTOCHECKPOINT``
+    pages (default 10000, ~40 MB at 4 KiB pages) so large ingests are not
+    stalled by a checkpoint every 1000 pages; ``0`` disables auto-checkpoints.
+    """
+
+    row = conn.execute("PRAGMA journal_mode;").fetchone()
+    wal = row is not None and str(row[0]).lower() == "wal"
+    override = str(os.getenv("OPENCLAW_MEM_SYNC") or "").strip().upper()
+    if override in _SQLITE_SYNC_LEVELS:
+        conn.execute(f"PRAGMA synchronous={override};")
+    elif wal:
+        conn.execute("PRAGMA synchronous=NORMAL;")
+    if wal:
+        conn.execute(f"PRAGMA wal_autocheckpoint={_wal_autocheckpoint_pages()};")
+
+
+def _checkpoint_wal_truncate(conn: sqlite3.Connection) -> None:
+    """Fold the WAL back into the database and truncate it (best-effort).
+
+    Used after bulk loads so the raised auto-checkpoint threshold does not
+    leave a large WAL file behind. A busy reader only makes this a no-op.
+    """
+
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchone()
+    except sqlite3.Error:
+        pass
+
+
 @dataclass(frozen=True)
 class Migration:
     id: int
@@ -122,22 +171,65 @@ def _connect(db_path: str) -> sqlite3.Connection:
             ).fetchone() is not None
             _init_db(conn)
             if not had_user_schema:
-                for migration in MIGRATIONS:
-                    if migration.id > 1:
-                        migration.apply(conn)
-                conn.execute(f"PRAGMA user_version = {CURRENT_DB_VERSION}")
-                conn.commit()
+                _migrate_new_database(conn)
             user_version = int(conn.execute("PRAGMA user_version").fetchone()[0])
     # Opening a database with a pending expensive migration is deliberately a
     # zero-write compatibility lane. Even switching journal mode would mutate
     # the file, so WAL is enabled only once the database is current.
     if user_version >= CURRENT_DB_VERSION:
         _enable_wal_best_effort(conn)
+        _tune_write_durability(conn)
     else:
         conn.execute("PRAGMA busy_timeout=5000;")
     return conn
 
 
+def _migrate_new_database(conn: sqlite3.Connection) -> None:
+    """Bring a freshly baselined, previously empty database to the current version."""
+
+    for migration in MIGRATIONS:
+        if migration.id > 1:
+            migration.apply(conn)
+    conn.execute(f"PRAGMA user_version = {CURRENT_DB_VERSION}")
+    conn.commit()
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    """Close a `_connect` connection after a best-effort ``PRAGMA optimize``.
+
+    optimize only runs ANALYZE where this session's queries showed stale
+    planner stats, and only sessions that wrote rows ask for it: read
+    commands, read-only files, and pending-migration connections must stay
+    zero-write, so they are closed untouched.
+    """
+
+    try:
+        readonly_db = str(os.environ.get("OPENCLAW_MEM_READONLY_DB") or "").strip().lower() in {"1", "true", "yes", "on"}
+        if (
+            not readonly_db
+            and conn.total_changes > 0
+            and int(conn.execute("PRAGMA user_version").fetchone()[0]) >= CURRENT_DB_VERSION
+        ):
+            conn.execute("PRAGMA optimize;")
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+
+
+def _write_meta_stamp(conn: sqlite3.Connection) -> None:
+    stamp = {
+        "min_reader_version": "1",
+        "last_writer_version": __version__,
+        "last_writer_ts": _utcnow_iso(),
+    }
+    conn.executemany(
+        "INSERT INTO meta(key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        stamp.items(),
+    )
+
+
 def _init_db(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
@@ -426,16 +518,7 @@ def _init_db(conn: sqlite3.Connection) -> None:
         conn.execute(
             "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
         )
-        stamp = {
-            "min_reader_version": "1",
-            "last_writer_version": __version__,
-            "last_writer_ts": _utcnow_iso(),
-        }
-        conn.executemany(
-            "INSERT INTO meta(key, value) VALUES (?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            stamp.items(),
-        )
+        _write_meta_stamp(conn)
         user_version = int(conn.execute("PRAGMA user_version").fetchone()[0])
         if user_version == 0:
             conn.execute("PRAGMA user_version = 1")
@@ -24,7 +24,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from openclaw_mem import __version__
 from openclaw_mem import defaults
 from openclaw_mem.scope import normalize_scope_token
-from openclaw_mem.vector import l2_norm, pack_f32, rank_cosine, rank_rrf
+from openclaw_mem.vector import pack_f32_with_norm, rank_cosine, rank_rrf
 
 
 EPISODIC_ALLOWED_TYPES = {
@@ -903,7 +903,7 @@ def embed_events(
                 (event_row_id, model, dim, vector, norm, search_text_hash, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
-                (int(item["id"]), model_name, len(vector), pack_f32(vector), l2_norm(vector), str(item["search_text_hash"]), created_at),
+                (int(item["id"]), model_name, len(vector), *pack_f32_with_norm(vector), str(item["search_text_hash"]), created_at),
             )
             embedded_ids.append(int(item["id"]))
             scope_key = str(item["scope"] or "")
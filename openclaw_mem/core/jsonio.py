@@ -0,0 +1,26 @@
+"""Shared JSON decode helper with an optional orjson fast path."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+    _orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from raw bytes (or text) in one pass.
+
+    orjson parses UTF-8 bytes directly when installed. Anything it rejects
+    (NaN/Infinity literals, lone surrogate escapes) is retried with the stdlib
+    decoder, so results and error types match ``json.loads``.
+    """
+
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
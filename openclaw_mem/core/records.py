@@ -12,9 +12,10 @@ from functools import lru_cache
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Protocol, Tuple
 
-from openclaw_mem.core.db import _sanitize_jsonable_surrogates, _sanitize_str_surrogates
+from openclaw_mem.core import jsonio
+from openclaw_mem.core.db import _checkpoint_wal_truncate, _sanitize_jsonable_surrogates, _sanitize_str_surrogates
 
 _IMPORTANCE_LABEL_KEYS = ("must_remember", "nice_to_have", "ignore", "unknown")
 
@@ -188,23 +189,31 @@ def ingest_observations(
     observations: Iterable[Dict[str, Any]],
     *,
     importance_scorer: str | None = None,
+    bulk: bool = False,
 ) -> Dict[str, Any]:
-    """Insert an observation stream and return its deterministic receipt."""
+    """Insert an observation stream and return its deterministic receipt.
+
+    ``bulk`` skips per-batch FTS indexing and rebuilds the FTS lanes once after
+    the stream, which is cheaper for large loads into a small store. The WAL
+    is then checkpointed and truncated so the load does not leave it large.
+    """
 
     apply_importance_scorer_override(importance_scorer)
     summary = IngestRunSummary()
     taxonomy_enabled = _taxonomy_enabled()
-    inserted = [
-        _insert_observation(
-            conn,
-            obs,
-            summary,
-            taxonomy_enabled=taxonomy_enabled,
-        )
-        for obs in observations
-    ]
+    inserted = _insert_observation_stream(
+        conn,
+        observations,
+        summary,
+        taxonomy_enabled=taxonomy_enabled,
+        index_fts=not bulk,
+    )
+    if bulk:
+        _rebuild_observation_fts(conn)
     conn.commit()
-    return {
+    if bulk:
+        _checkpoint_wal_truncate(conn)
+    receipt: Dict[str, Any] = {
         "inserted": len(inserted),
         "ids": inserted[:50],
         "total_seen": summary.total_seen,
@@ -214,6 +223,18 @@ def ingest_observations(
         "scorer_errors": summary.scorer_errors,
         "label_counts": summary.normalized_label_counts(),
     }
+    if bulk:
+        receipt["fts_rebuilt"] = True
+    return receipt
+
+
+_UPSERT_EMBEDDING_SQL = {
+    table: (
+        f"INSERT OR REPLACE INTO {table} "
+        "(observation_id, model, dim, vector, norm, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    for table in ("observation_embeddings", "observation_embeddings_en")
+}
 
 
 def _atomic_append_file(path: Path, content: str) -> None:
@@ -234,6 +255,30 @@ def _atomic_append_file(path: Path, content: str) -> None:
     tmp_path.replace(path)
 
 
+def _append_file(path: Path, content: str) -> None:
+    """Append with one O_APPEND write under an exclusive advisory lock.
+
+    Daily notes only ever grow, so this avoids re-reading and rewriting the
+    whole file per stored memory. Platforms without fcntl keep the
+    temp-file + replace path.
+    """
+
+    try:
+        import fcntl
+    except ModuleNotFoundError:  # pragma: no cover - Windows
+        _atomic_append_file(path, content)
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as fp:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        try:
+            fp.write(content)
+            fp.flush()
+        finally:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
 def store_memory(
     conn: sqlite3.Connection,
     *,
@@ -304,23 +349,18 @@ def store_memory(
             client = embedding_client_factory(api_key=api_key, base_url=base_url)
     if client is not None:
         try:
-            from openclaw_mem.vector import l2_norm, pack_f32
+            from openclaw_mem.vector import pack_f32_with_norm
 
             created_at = _utcnow_iso()
-            vec = client.embed([normalized_text], model=model)[0]
-            conn.execute(
-                """INSERT OR REPLACE INTO observation_embeddings
-                   (observation_id, model, dim, vector, norm, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (rowid, model, len(vec), pack_f32(vec), l2_norm(vec), created_at),
-            )
+            lanes = [("observation_embeddings", normalized_text)]
             if normalized_text_en:
-                vec_en = client.embed([normalized_text_en], model=model)[0]
+                lanes.append(("observation_embeddings_en", normalized_text_en))
+            for table, lane_text in lanes:
+                vec = client.embed([lane_text], model=model)[0]
+                blob, norm = pack_f32_with_norm(vec)
                 conn.execute(
-                    """INSERT OR REPLACE INTO observation_embeddings_en
-                       (observation_id, model, dim, vector, norm, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (rowid, model, len(vec_en), pack_f32(vec_en), l2_norm(vec_en), created_at),
+                    _UPSERT_EMBEDDING_SQL[table],
+                    (rowid, model, len(vec), blob, norm, created_at),
                 )
             embedded = True
         except Exception as exc:
@@ -338,7 +378,7 @@ def store_memory(
             f"(importance: {importance_obj['score']:.2f}, {importance_obj['label']})\n"
         )
         try:
-            _atomic_append_file(md_file, md_entry)
+            _append_file(md_file, md_entry)
             markdown_path = str(md_file)
             markdown_write_status = "written"
         except Exception as exc:
@@ -364,7 +404,7 @@ def _iter_jsonl(fp: Iterable[str]) -> Iterable[Dict[str, Any]]:
     for line in fp:
         stripped = line.strip()
         if stripped:
-            yield json.loads(stripped)
+            yield jsonio.loads(stripped)
 
 
 def harvest_observations(
@@ -393,7 +433,7 @@ def harvest_observations(
     operational failures are raised as :class:`HarvestError` receipts.
     """
 
-    from openclaw_mem.vector import l2_norm, pack_f32
+    from openclaw_mem.vector import pack_f32_with_norm
 
     apply_importance_scorer_override(importance_scorer)
     summary = IngestRunSummary()
@@ -435,15 +475,14 @@ def harvest_observations(
     for processing in processing_files:
         try:
             with processing.open("r", encoding="utf-8") as fp:
-                for observation in _iter_jsonl(fp):
-                    inserted_ids.append(
-                        _insert_observation(
-                            conn,
-                            observation,
-                            summary,
-                            taxonomy_enabled=taxonomy_enabled,
-                        )
+                inserted_ids.extend(
+                    _insert_observation_stream(
+                        conn,
+                        _iter_jsonl(fp),
+                        summary,
+                        taxonomy_enabled=taxonomy_enabled,
                     )
+                )
             conn.commit()
         except Exception as exc:
             raise HarvestError({"error": f"Ingest failed: {exc}", "file": str(processing)}) from exc
@@ -494,21 +533,12 @@ def harvest_observations(
                         for row in chunk
                     ]
                     vectors = client.embed(texts, model=model)
-                    for row, vector in zip(chunk, vectors):
-                        conn.execute(
-                            """INSERT OR REPLACE INTO observation_embeddings
-                               (observation_id, model, dim, vector, norm, created_at)
-                               VALUES (?, ?, ?, ?, ?, ?)""",
-                            (
-                                int(row["id"]),
-                                model,
-                                len(vector),
-                                pack_f32(vector),
-                                l2_norm(vector),
-                                created_at,
-                            ),
-                        )
-                        embedded += 1
+                    params = [
+                        (int(row["id"]), model, len(vector), *pack_f32_with_norm(vector), created_at)
+                        for row, vector in zip(chunk, vectors)
+                    ]
+                    conn.executemany(_UPSERT_EMBEDDING_SQL[table], params)
+                    embedded += len(params)
                     conn.commit()
             except Exception as exc:
                 embed_error = str(exc)
@@ -549,6 +579,110 @@ def harvest_observations(
     return receipt, warnings
 
 
+ObservationRow = Tuple[str, Any, Any, Any, Any, Any, str]
+
+_INSERT_OBSERVATION_SQL = (
+    "INSERT INTO observations (ts, kind, summary, summary_en, lang, tool_name, detail_json) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+# The FTS lanes are content tables over `observations`, so a freshly
+# inserted id range is indexed straight from the base rows.
+_INDEX_OBSERVATION_FTS_SQL = (
+    "INSERT INTO observations_fts (rowid, summary, summary_en, tool_name, detail_json) "
+    "SELECT id, summary, summary_en, tool_name, detail_json FROM observations "
+    "WHERE id BETWEEN ? AND ?"
+)
+_INDEX_OBSERVATION_FTS_TRI_SQL = (
+    "INSERT INTO observations_fts_tri (rowid, summary, summary_en) "
+    "SELECT id, summary, summary_en FROM observations WHERE id BETWEEN ? AND ?"
+)
+_INSERT_BATCH_SIZE = 500
+# Observation keys mapped onto columns; anything else is folded into detail_json.
+_OBSERVATION_KNOWN_KEYS = frozenset(
+    {
+        "ts",
+        "kind",
+        "summary",
+        "summary_en",
+        "text_en",
+        "lang",
+        "tool_name",
+        "tool",
+        "detail",
+        "detail_json",
+    }
+)
+
+
+def _has_trigram_index(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'observations_fts_tri'"
+    ).fetchone() is not None
+
+
+def _insert_observation_rows(
+    conn: sqlite3.Connection,
+    rows: List[ObservationRow],
+    *,
+    index_fts: bool = True,
+    trigram: bool | None = None,
+) -> List[int]:
+    """Insert prepared observation rows plus their FTS entries.
+
+    Base rows go in with one executemany inside the connection's open write
+    transaction, so their AUTOINCREMENT ids are the contiguous run ending at
+    ``last_insert_rowid()``. Each FTS lane is then filled from that id range
+    with a single INSERT ... SELECT. Callers passing ``index_fts=False`` own
+    rebuilding the FTS lanes afterwards. ``trigram`` lets batch callers
+    probe for the trigram lane once instead of once per batch.
+    """
+
+    if not rows:
+        return []
+    conn.executemany(_INSERT_OBSERVATION_SQL, rows)
+    last_id = int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+    first_id = last_id - len(rows) + 1
+    if not index_fts:
+        return list(range(first_id, last_id + 1))
+    conn.execute(_INDEX_OBSERVATION_FTS_SQL, (first_id, last_id))
+    if trigram is None:
+        trigram = _has_trigram_index(conn)
+    if trigram:
+        conn.execute(_INDEX_OBSERVATION_FTS_TRI_SQL, (first_id, last_id))
+    return list(range(first_id, last_id + 1))
+
+
+def _rebuild_observation_fts(conn: sqlite3.Connection) -> None:
+    """Rebuild both observation FTS content lanes from the base table."""
+
+    conn.execute("INSERT INTO observations_fts(observations_fts) VALUES('rebuild')")
+    if _has_trigram_index(conn):
+        conn.execute("INSERT INTO observations_fts_tri(observations_fts_tri) VALUES('rebuild')")
+
+
+def _insert_observation_stream(
+    conn: sqlite3.Connection,
+    observations: Iterable[Dict[str, Any]],
+    run_summary: IngestRunSummaryLike | None = None,
+    *,
+    taxonomy_enabled: bool | None = None,
+    index_fts: bool = True,
+) -> List[int]:
+    """Prepare and insert an observation stream in `_INSERT_BATCH_SIZE` chunks."""
+
+    trigram = _has_trigram_index(conn) if index_fts else False
+
+    inserted: List[int] = []
+    batch: List[ObservationRow] = []
+    for obs in observations:
+        batch.append(_prepare_observation_row(obs, run_summary, taxonomy_enabled=taxonomy_enabled))
+        if len(batch) >= _INSERT_BATCH_SIZE:
+            inserted.extend(_insert_observation_rows(conn, batch, index_fts=index_fts, trigram=trigram))
+            batch = []
+    inserted.extend(_insert_observation_rows(conn, batch, index_fts=index_fts, trigram=trigram))
+    return inserted
+
+
 def _insert_observation(
     conn: sqlite3.Connection,
     obs: Dict[str, Any],
@@ -556,6 +690,18 @@ def _insert_observation(
     *,
     taxonomy_enabled: bool | None = None,
 ) -> int:
+    row = _prepare_observation_row(obs, run_summary, taxonomy_enabled=taxonomy_enabled)
+    return _insert_observation_rows(conn, [row])[0]
+
+
+def _prepare_observation_row(
+    obs: Dict[str, Any],
+    run_summary: IngestRunSummaryLike | None = None,
+    *,
+    taxonomy_enabled: bool | None = None,
+) -> ObservationRow:
+    """Normalize one observation (and grade it if enabled) into an INSERT row."""
+
     ts = obs.get("ts") or _utcnow_iso()
 
     kind = obs.get("kind")
@@ -591,19 +737,7 @@ def _insert_observation(
     else:
         detail_obj = {"_detail": base_detail}
 
-    known_keys = {
-        "ts",
-        "kind",
-        "summary",
-        "summary_en",
-        "text_en",
-        "lang",
-        "tool_name",
-        "tool",
-        "detail",
-        "detail_json",
-    }
-    extras = {k: v for k, v in obs.items() if k not in known_keys}
+    extras = {k: v for k, v in obs.items() if k not in _OBSERVATION_KNOWN_KEYS}
     if extras:
         detail_obj.update(extras)
 
@@ -690,21 +824,4 @@ def _insert_observation(
             run_summary.skipped_disabled += 1
 
     detail_json = json.dumps(detail_obj, ensure_ascii=False)
-
-    cur = conn.execute(
-        "INSERT INTO observations (ts, kind, summary, summary_en, lang, tool_name, detail_json) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (ts, kind, summary, summary_en, lang, tool_name, detail_json),
-    )
-    rowid = cur.lastrowid
-    conn.execute(
-        "INSERT INTO observations_fts (rowid, summary, summary_en, tool_name, detail_json) VALUES (?, ?, ?, ?, ?)",
-        (rowid, summary, summary_en, tool_name, detail_json),
-    )
-    if conn.execute(
-        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'observations_fts_tri'"
-    ).fetchone():
-        conn.execute(
-            "INSERT INTO observations_fts_tri (rowid, summary, summary_en) VALUES (?, ?, ?)",
-            (rowid, summary, summary_en),
-        )
-    return int(rowid)
+    return (ts, kind, summary, summary_en, lang, tool_name, detail_json)
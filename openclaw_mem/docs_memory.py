@@ -21,6 +21,7 @@ class DocsChunk:
 
 _HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*$")
 _FENCE_RE = re.compile(r"^\s{0,3}(```+|~~~+)")
+_HEADING_CLOSE_RE = re.compile(r"\s+#+\s*$")
 _FRONTMATTER_DATE_RE = re.compile(r"^\s*date\s*:\s*([0-9]{4}-[0-9]{2}-[0-9]{2})\s*$", re.IGNORECASE)
 _PATH_DATE_RE = re.compile(r"(20\d{2})[-_]?([01]\d)[-_]?([0-3]\d)")
 
@@ -70,31 +71,76 @@ def parse_ts_hint(text: str, file_path: str) -> Optional[str]:
     return f"{m2.group(1)}-{m2.group(2)}-{m2.group(3)}"
 
 
-def _split_by_headings(markdown_text: str, *, default_title: str) -> List[Tuple[str, str, List[str]]]:
-    lines = (markdown_text or "").splitlines()
+def _pack_paragraphs(paragraphs: List[str], *, max_chars: int) -> List[str]:
+    chunks: List[str] = []
+    buf: List[str] = []
+    buf_len = 0
+
+    for p in paragraphs:
+        size = len(p)
+        if size > max_chars:
+            if buf:
+                chunks.append("\n\n".join(buf))
+                buf = []
+            for i in range(0, size, max_chars):
+                chunks.append(p[i : i + max_chars].strip())
+            continue
+
+        if buf and buf_len + 2 + size <= max_chars:
+            buf.append(p)
+            buf_len += 2 + size
+        else:
+            if buf:
+                chunks.append("\n\n".join(buf))
+            buf = [p]
+            buf_len = size
+
+    if buf:
+        chunks.append("\n\n".join(buf))
+    return chunks
+
+
+def _split_by_headings(markdown_text: str, *, default_title: str, max_chars: int) -> List[Tuple[str, str, List[str]]]:
+    """Split markdown into heading sections and chunk each one in the same pass.
+
+    Paragraph boundaries (runs of non-blank lines) are recorded while the lines
+    are scanned, so oversized sections are packed without re-splitting their text.
+    """
     sections: List[Tuple[str, str, List[str]]] = []
 
     heading_stack: List[str] = []
     current_heading_path = ""
     current_title = default_title or "(root)"
     current_lines: List[str] = []
+    para_bounds: List[Tuple[int, int]] = []
+    para_start = 0
+
+    def flush_section() -> None:
+        # A section with no recorded paragraph holds only blank lines.
+        if not para_bounds and para_start >= len(current_lines):
+            return
+        text = "\n".join(current_lines).strip()
+        if len(text) <= max_chars:
+            chunks = [text]
+        else:
+            bounds = para_bounds + [(para_start, len(current_lines))]
+            paragraphs = ["\n".join(current_lines[a:b]).strip() for a, b in bounds if a < b]
+            chunks = _pack_paragraphs(paragraphs, max_chars=max_chars)
+        sections.append((current_heading_path, current_title, chunks))
 
     in_code = False
-    for line in lines:
+    for line in (markdown_text or "").splitlines():
         if _FENCE_RE.match(line):
             in_code = not in_code
-            current_lines.append(line)
-            continue
-
-        if not in_code:
+        elif not in_code and line.find("#", 0, 4) != -1:
+            # Headings start with '#' within the first four columns; the
+            # cheap find keeps the regex off ordinary body lines.
             m = _HEADING_RE.match(line)
             if m:
-                content = "\n".join(current_lines).strip()
-                if content:
-                    sections.append((current_heading_path, current_title, current_lines))
+                flush_section()
 
                 level = len(m.group(1))
-                heading = re.sub(r"\s+#+\s*$", "", (m.group(2) or "").strip()).strip() or "(untitled)"
+                heading = _HEADING_CLOSE_RE.sub("", (m.group(2) or "").strip()).strip() or "(untitled)"
 
                 heading_stack = heading_stack[: max(0, level - 1)]
                 heading_stack.append(heading)
@@ -102,64 +148,28 @@ def _split_by_headings(markdown_text: str, *, default_title: str) -> List[Tuple[
                 current_heading_path = " / ".join(heading_stack)
                 current_title = heading
                 current_lines = []
+                para_bounds = []
+                para_start = 0
                 continue
 
-        current_lines.append(line)
-
-    tail = "\n".join(current_lines).strip()
-    if tail:
-        sections.append((current_heading_path, current_title, current_lines))
-
-    return sections
-
-
-def _chunk_section_text(raw_lines: List[str], *, max_chars: int) -> List[str]:
-    text = "\n".join(raw_lines).strip()
-    if not text:
-        return []
-    if len(text) <= max_chars:
-        return [text]
-
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
-    chunks: List[str] = []
-    buf = ""
-
-    def flush() -> None:
-        nonlocal buf
-        if buf.strip():
-            chunks.append(buf.strip())
-        buf = ""
-
-    for p in paragraphs:
-        if len(p) > max_chars:
-            flush()
-            i = 0
-            while i < len(p):
-                chunks.append(p[i : i + max_chars].strip())
-                i += max_chars
-            continue
-
-        candidate = p if not buf else f"{buf}\n\n{p}"
-        if len(candidate) <= max_chars:
-            buf = candidate
+        if not line or line.isspace():
+            if para_start < len(current_lines):
+                para_bounds.append((para_start, len(current_lines)))
+            current_lines.append(line)
+            para_start = len(current_lines)
         else:
-            flush()
-            buf = p
+            current_lines.append(line)
 
-    flush()
-    return chunks
+    flush_section()
+    return sections
 
 
 def chunk_markdown(markdown_text: str, *, default_title: str, max_chars: int = 1400) -> List[DocsChunk]:
-    sections = _split_by_headings(markdown_text, default_title=default_title)
+    sections = _split_by_headings(markdown_text, default_title=default_title, max_chars=max(200, int(max_chars)))
     out: List[DocsChunk] = []
 
     section_name_counts: Dict[str, int] = {}
-    for heading_path, title, raw_lines in sections:
-        chunks = _chunk_section_text(raw_lines, max_chars=max(200, int(max_chars)))
-        if not chunks:
-            continue
-
+    for heading_path, title, chunks in sections:
         base = slugify(heading_path or "root")
         section_name_counts[base] = section_name_counts.get(base, 0) + 1
         seen_count = section_name_counts[base]
@@ -187,8 +197,9 @@ def make_doc_id(repo: str, rel_path: str) -> str:
 
 
 def chunk_content_hash(*, heading_path: str, title: str, text: str) -> str:
-    material = "\n".join([(heading_path or "").strip(), (title or "").strip(), (text or "").strip()])
-    return hashlib.sha1(material.encode("utf-8")).hexdigest()
+    # Content fingerprint only (not a security boundary); stored hashes must stay SHA-1 compatible.
+    material = f"{(heading_path or '').strip()}\n{(title or '').strip()}\n{(text or '').strip()}"
+    return hashlib.sha1(material.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 def make_record_ref(*, repo: str, rel_path: str, chunk_id: str) -> str:
@@ -212,8 +223,8 @@ def rrf_components(
     vec_ids: Sequence[int],
     k: int,
 ) -> List[Dict[str, object]]:
-    fts_rank = {rid: idx for idx, rid in enumerate(fts_ids)}
-    vec_rank = {rid: idx for idx, rid in enumerate(vec_ids)}
+    fts_rank = dict(zip(fts_ids, range(len(fts_ids))))
+    vec_rank = dict(zip(vec_ids, range(len(vec_ids))))
 
     out: List[Dict[str, object]] = []
     for rid, score in fused:
@@ -3,11 +3,181 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 from openclaw_mem.importance import make_importance
 from openclaw_mem.task_markers import summary_has_task_marker, strip_markdown_task_prefix
 
+# Patterns and keyword tables are built once at import; grade_observation runs
+# per ingested row.
+# Stable identifiers, all found by one scan: URLs, UUIDs, config paths (biased
+# toward the one we actually care about in MVP), and env vars (kept narrow and
+# case-sensitive to avoid false positives).
+_IDENT_RE = re.compile(
+    r"(?P<url>https?://\S+)"
+    r"|(?P<uuid>\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b)"
+    r"|(?P<cfg>\bagents\.[a-z0-9_.]+\b)"
+    r"|(?P<env>(?-i:OPENCLAW_))",
+    re.IGNORECASE,
+)
+_SECRET_BLOCK_RE = re.compile(r"BEGIN (RSA|OPENSSH) PRIVATE KEY", re.IGNORECASE)
+_DEADLINE_DATE_RE = re.compile(r"\bby\s+\d{4}-\d{2}-\d{2}\b")
+_CHITCHAT_RE = re.compile(r"\b(lol|thanks|thx|ok|got it|nice)\b")
+_CLOCK_TIME_RE = re.compile(r"\b\d{1,2}(am|pm)\b")
+_HHMM_TIME_RE = re.compile(r"\b\d{1,2}:\d{2}\b")
+
+_MD_PREFIX_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^>+\s*",
+        # Common bullet glyphs (including unicode dashes used as bullets).
+        r"^(?:[-*+•▪‣∙·◦・–—−])\s*",
+        # Ordered list prefixes.
+        r"^\(\s*\d+\s*\)\s*",
+        r"^（\s*\d+\s*）\s*",
+        r"^\d{1,3}\)\s*",
+        r"^\d{1,3}\.\s+",
+        r"^\d{1,3}\.(?=[^0-9\s])",
+        r"^\d{1,3}(?:-|－|–|—|−)\s+",
+        r"^\d{1,3}(?:-|－|–|—|−)(?=[^0-9\s])",
+        # Markdown checkboxes.
+        r"^\[(?: |x|X|✓|✔|☐|☑|☒|✅)\]\s*",
+        r"^[☐☑☒✅✔]\s*",
+    )
+)
+
+_CLI_KW = ("uv run", "python -m", "openclaw ", "openclaw-mem")
+_SECRET_KW = ("sk-", "ghp_", "AKIA")
+_PREFERENCE_KW = (
+    "prefer",
+    "preference",
+    "always",
+    "never",
+    "must",
+    "should",
+    "do not",
+    "don't",
+    "required",
+    "rule",
+    "policy",
+    "hard requirement",
+)
+_PREFERENCE_CJK_KW = ("偏好", "規則", "一定", "必須", "不要", "禁止", "原則", "硬性", "需求", "不做", "不改")
+_DECISION_KW = (
+    "decide",
+    "decision",
+    "decided",
+    "chose",
+    "chosen",
+    "we will",
+    "we'll",
+    "mvp",
+    "scope",
+    "architecture",
+)
+_DECISION_CJK_KW = ("決定", "選擇", "採用", "方案", "架構", "範圍")
+_SETUP_KW = ("created", "create", "added", "set up", "setup")
+_SETUP_REF_KW = ("repo", "repository", "cron", "jobid", "github.com")
+_RUNBOOK_KW = (
+    "cron",
+    "every ",
+    "tz",
+    "asia/taipei",
+    "how to",
+    "how to run",
+    "openclaw ",
+    "uv run",
+    "python -m",
+)
+_ERROR_KW = (
+    "error",
+    "failed",
+    "exception",
+    "traceback",
+    "timeout",
+    "rate_limit",
+    "unauthorized",
+    "forbidden",
+)
+_ERROR_FIX_KW = ("root cause", "fixed by", "workaround", "mitigation", "resolved by")
+_DEADLINE_KW = ("today", "tomorrow", "eod", "before")
+_DEADLINE_CJK_KW = ("今天", "明天", "之前")
+_CHITCHAT_CJK_KW = ("收到", "謝謝", "哈哈")
+_PROGRESS_KW = ("done", "finished", "pushed", "merged", "wip")
+_MEETING_KW = ("meeting", "call")
+_MEETING_CJK_KW = ("開會", "約")
+
+# Category bits for the lowercase keyword scan.
+_KW_CLI = 1 << 0
+_KW_PREFERENCE = 1 << 1
+_KW_DECISION = 1 << 2
+_KW_SETUP = 1 << 3
+_KW_SETUP_REF = 1 << 4
+_KW_RUNBOOK = 1 << 5
+_KW_ERROR = 1 << 6
+_KW_ERROR_FIX = 1 << 7
+_KW_DEADLINE = 1 << 8
+_KW_PROGRESS = 1 << 9
+_KW_MEETING = 1 << 10
+_KW_CHITCHAT = 1 << 11
+# Non-keyword signals. With the keyword bits they fully determine a grade.
+_SIG_TASK = 1 << 12
+_SIG_IDENT = 1 << 13
+_SIG_SECRET = 1 << 14
+_SIG_CLOCK_TIME = 1 << 15
+
+
+def _build_keyword_table(groups: Tuple[Tuple[int, Tuple[str, ...]], ...]) -> Tuple[Tuple[str, int], ...]:
+    """Merge keyword groups into one ``(keyword, category bits)`` scan table.
+
+    Keywords shared by several categories are scanned once. A keyword that
+    contains another keyword carrying the same bits (``decided`` vs
+    ``decide``) can never add a bit, so it is dropped from the scan.
+    """
+
+    bits: Dict[str, int] = {}
+    for flag, keywords in groups:
+        for keyword in keywords:
+            bits[keyword] = bits.get(keyword, 0) | flag
+    return tuple(
+        (keyword, flag)
+        for keyword, flag in bits.items()
+        if not any(
+            other != keyword and other in keyword and (flag & ~bits[other]) == 0
+            for other in bits
+        )
+    )
+
+
+_KEYWORD_TABLE = _build_keyword_table(
+    (
+        (_KW_CLI, _CLI_KW),
+        (_KW_PREFERENCE, _PREFERENCE_KW),
+        (_KW_DECISION, _DECISION_KW),
+        (_KW_SETUP, _SETUP_KW),
+        (_KW_SETUP_REF, _SETUP_REF_KW),
+        (_KW_RUNBOOK, _RUNBOOK_KW),
+        (_KW_ERROR, _ERROR_KW),
+        (_KW_ERROR_FIX, _ERROR_FIX_KW),
+        (_KW_DEADLINE, _DEADLINE_KW),
+        (_KW_PROGRESS, _PROGRESS_KW),
+        (_KW_MEETING, _MEETING_KW),
+    )
+)
+# CJK keywords share the category bits of their English counterparts. Lowercasing
+# leaves CJK characters untouched, so they are scanned in ``tl`` too, but only
+# when the text is not pure ASCII.
+_CJK_KEYWORD_TABLE = _build_keyword_table(
+    (
+        (_KW_PREFERENCE, _PREFERENCE_CJK_KW),
+        (_KW_DECISION, _DECISION_CJK_KW),
+        (_KW_DEADLINE, _DEADLINE_CJK_KW),
+        (_KW_CHITCHAT, _CHITCHAT_CJK_KW),
+        (_KW_MEETING, _MEETING_CJK_KW),
+    )
+)
+
 
 def _clamp01(x: float) -> float:
     if x < 0.0:
@@ -37,49 +207,34 @@ class GradeResult:
         )
 
 
-def _text_from_obs(obs: Dict[str, Any]) -> str:
+def _text_from_obs(obs: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the graded text and its lowercase form (computed once per observation)."""
+
     tool = (obs.get("tool_name") or obs.get("tool") or "").strip()
     summary = (obs.get("summary") or "").strip()
     if tool and summary:
-        return f"{tool}: {summary}"
-    return summary or tool
+        text = f"{tool}: {summary}"
+    else:
+        text = summary or tool
+    return text, text.lower()
 
 
-def _has_url(text: str) -> bool:
-    return bool(re.search(r"https?://\S+", text or "", flags=re.IGNORECASE))
+def _has_identifier(text: str) -> bool:
+    return _IDENT_RE.search(text) is not None
 
 
-def _has_uuid(text: str) -> bool:
-    return bool(
-        re.search(
-            r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
-            text or "",
-            flags=re.IGNORECASE,
-        )
-    )
-
+def _keyword_flags(tl: str) -> int:
+    """Tag every keyword category present in lowercase text in one table walk."""
 
-def _has_config_path(text: str) -> bool:
-    # Bias toward the one we actually care about in MVP.
-    return bool(re.search(r"\bagents\.[a-z0-9_.]+\b", (text or ""), flags=re.IGNORECASE))
-
-
-def _has_env_var(text: str) -> bool:
-    # Keep this narrow to avoid false positives.
-    return "OPENCLAW_" in (text or "")
-
-
-def _has_cli_command(text: str) -> bool:
-    t = (text or "").lower()
-    return any(
-        s in t
-        for s in [
-            "uv run",
-            "python -m",
-            "openclaw ",
-            "openclaw-mem",
-        ]
-    )
+    flags = 0
+    for keyword, flag in _KEYWORD_TABLE:
+        if keyword in tl:
+            flags |= flag
+    if not tl.isascii():
+        for keyword, flag in _CJK_KEYWORD_TABLE:
+            if keyword in tl:
+                flags |= flag
+    return flags
 
 
 def _strip_md_task_prefix(text: str) -> str:
@@ -101,23 +256,8 @@ def _strip_md_task_prefix(text: str) -> str:
     # Keep the patterns conservative to avoid stripping leading timestamps/dates.
     while prev != t:
         prev = t
-        t = re.sub(r"^>+\s*", "", t).lstrip()
-
-        # Common bullet glyphs (including unicode dashes used as bullets).
-        t = re.sub(r"^(?:[-*+•▪‣∙·◦・–—−])\s*", "", t).lstrip()
-
-        # Ordered list prefixes.
-        t = re.sub(r"^\(\s*\d+\s*\)\s*", "", t).lstrip()
-        t = re.sub(r"^（\s*\d+\s*）\s*", "", t).lstrip()
-        t = re.sub(r"^\d{1,3}\)\s*", "", t).lstrip()
-        t = re.sub(r"^\d{1,3}\.\s+", "", t).lstrip()
-        t = re.sub(r"^\d{1,3}\.(?=[^0-9\s])", "", t).lstrip()
-        t = re.sub(r"^\d{1,3}(?:-|－|–|—|−)\s+", "", t).lstrip()
-        t = re.sub(r"^\d{1,3}(?:-|－|–|—|−)(?=[^0-9\s])", "", t).lstrip()
-
-        # Markdown checkboxes.
-        t = re.sub(r"^\[(?: |x|X|✓|✔|☐|☑|☒|✅)\]\s*", "", t).lstrip()
-        t = re.sub(r"^[☐☑☒✅✔]\s*", "", t).lstrip()
+        for prefix_re in _MD_PREFIX_RES:
+            t = prefix_re.sub("", t).lstrip()
 
     return t
 
@@ -125,11 +265,10 @@ def _strip_md_task_prefix(text: str) -> str:
 def _is_task_like(text: str, kind: str) -> bool:
     """Best-effort task detection for heuristic scoring."""
 
-    t = unicodedata.normalize("NFKC", (text or "")).strip()
-    kind_norm = (kind or "").strip().lower()
-    if kind_norm == "task":
+    if (kind or "").strip().lower() == "task":
         return True
 
+    t = unicodedata.normalize("NFKC", text or "").strip()
     if summary_has_task_marker(t):
         return True
 
@@ -142,6 +281,8 @@ def _is_task_like(text: str, kind: str) -> bool:
     if "要做" in t_stripped or "待辦" in t_stripped:
         return True
     return False
+
+
 def grade_observation(obs: Dict[str, Any]) -> GradeResult:
     """Deterministic heuristic importance grading (heuristic-v1).
 
@@ -155,8 +296,46 @@ def grade_observation(obs: Dict[str, Any]) -> GradeResult:
     """
 
     kind = str(obs.get("kind") or "").strip()
-    text = _text_from_obs(obs)
-    tl = (text or "").lower()
+    text, tl = _text_from_obs(obs)
+
+    signals = _SIG_TASK if _is_task_like(text, kind) else 0
+    # Empty text has nothing to scan: only the task-kind signal can apply.
+    if text:
+        signals |= _text_signals(text, tl, is_task=bool(signals))
+    return _grade_signals(signals)
+
+
+def _text_signals(text: str, tl: str, *, is_task: bool) -> int:
+    """Extract every scoring signal of non-empty text as one bitmask.
+
+    Regex probes whose answer cannot change the grade are skipped.
+    """
+
+    signals = _keyword_flags(tl)
+    if signals & _KW_CLI or _has_identifier(text):
+        signals |= _SIG_IDENT
+    if any(s in text for s in _SECRET_KW) or _SECRET_BLOCK_RE.search(text):
+        signals |= _SIG_SECRET
+    if is_task and not signals & _KW_DEADLINE and _DEADLINE_DATE_RE.search(tl):
+        signals |= _KW_DEADLINE
+    if not signals & _KW_CHITCHAT and _CHITCHAT_RE.search(tl):
+        signals |= _KW_CHITCHAT
+    if signals & _KW_MEETING and (_CLOCK_TIME_RE.search(tl) or _HHMM_TIME_RE.search(tl)):
+        signals |= _SIG_CLOCK_TIME
+    return signals
+
+
+@lru_cache(maxsize=4096)
+def _grade_signals(signals: int) -> GradeResult:
+    """Score a signal bitmask.
+
+    The grade depends on nothing but the mask, so each distinct combination is
+    scored once and batch re-grading is mostly cache hits.
+    """
+
+    is_task = bool(signals & _SIG_TASK)
+    has_ident = bool(signals & _SIG_IDENT)
+    has_error = bool(signals & _KW_ERROR)
 
     # Baseline is intentionally non-zero so a single strong signal can push an item
     # into nice_to_have without requiring multiple matches.
@@ -164,71 +343,23 @@ def grade_observation(obs: Dict[str, Any]) -> GradeResult:
     reasons: List[str] = []
     penalties: List[str] = []
 
-    is_task = _is_task_like(text, kind)
-
-    # Precompute signal flags
-    has_url = _has_url(text)
-    has_uuid = _has_uuid(text)
-    has_cfg = _has_config_path(text)
-    has_env = _has_env_var(text)
-    has_cli = _has_cli_command(text)
-    has_ident = has_url or has_uuid or has_cfg or has_env or has_cli
-
     # J) Secret-like (down-rank)
-    if re.search(r"BEGIN (RSA|OPENSSH) PRIVATE KEY", text or "", flags=re.IGNORECASE) or any(
-        s in (text or "") for s in ["sk-", "ghp_", "AKIA"]
-    ):
+    if signals & _SIG_SECRET:
         score -= 0.40
         penalties.append("Secret-like content; down-ranked for safety.")
 
     # A) Constraints / preferences / policies
-    if any(
-        k in tl
-        for k in [
-            "prefer",
-            "preference",
-            "always",
-            "never",
-            "must",
-            "should",
-            "do not",
-            "don't",
-            "required",
-            "rule",
-            "policy",
-            "hard requirement",
-        ]
-    ) or any(k in text for k in ["偏好", "規則", "一定", "必須", "不要", "禁止", "原則", "硬性", "需求", "不做", "不改"]):
+    if signals & _KW_PREFERENCE:
         score += 0.40
         reasons.append("Durable preference/policy that affects future behavior.")
 
     # B) Decision / architecture choices
     if not is_task:
-        decision_kw = any(
-            k in tl
-            for k in [
-                "decide",
-                "decision",
-                "decided",
-                "chose",
-                "chosen",
-                "we will",
-                "we'll",
-                "mvp",
-                "scope",
-                "architecture",
-            ]
-        ) or any(k in text for k in ["決定", "選擇", "採用", "方案", "架構", "範圍"])
+        decision_kw = bool(signals & _KW_DECISION)
 
         # Treat durable system/project setup notes as decisions when paired with
         # stable references (repo URLs, cron job ids, etc.).
-        setup_kw = any(k in tl for k in ["created", "create", "added", "set up", "setup"]) and (
-            ("repo" in tl)
-            or ("repository" in tl)
-            or ("cron" in tl)
-            or ("jobid" in tl)
-            or ("github.com" in tl)
-        )
+        setup_kw = bool(signals & _KW_SETUP) and bool(signals & _KW_SETUP_REF)
 
         if decision_kw or setup_kw:
             score += 0.30
@@ -240,42 +371,16 @@ def grade_observation(obs: Dict[str, Any]) -> GradeResult:
         reasons.append("Contains stable identifiers useful for future lookup/automation.")
 
     # D) Operational runbooks / automation controls
-    if any(
-        k in tl
-        for k in [
-            "cron",
-            "every ",
-            "tz",
-            "asia/taipei",
-            "how to",
-            "how to run",
-            "openclaw ",
-            "uv run",
-            "python -m",
-        ]
-    ):
+    if signals & _KW_RUNBOOK:
         score += 0.20
         reasons.append("Repeatable operational step; useful as a runbook.")
 
     # E) Errors / incidents
-    has_error = any(
-        k in tl
-        for k in [
-            "error",
-            "failed",
-            "exception",
-            "traceback",
-            "timeout",
-            "rate_limit",
-            "unauthorized",
-            "forbidden",
-        ]
-    )
     if has_error:
         score += 0.15
         reasons.append("Operational issue with potential future recurrence.")
 
-        if any(k in tl for k in ["root cause", "fixed by", "workaround", "mitigation", "resolved by"]):
+        if signals & _KW_ERROR_FIX:
             score += 0.10
             reasons.append("Includes a cause/fix/workaround.")
 
@@ -284,30 +389,29 @@ def grade_observation(obs: Dict[str, Any]) -> GradeResult:
         score += 0.20
         reasons.append("Action item that remains relevant until done.")
 
-        if re.search(r"\bby\s+\d{4}-\d{2}-\d{2}\b", tl) or any(k in text for k in ["今天", "明天", "之前"]) or any(
-            k in tl for k in ["today", "tomorrow", "eod", "before"]
-        ):
+        if signals & _KW_DEADLINE:
             score += 0.10
             reasons.append("Has an explicit deadline/time window.")
 
     # G) Chit-chat / acknowledgements
-    if re.search(r"\b(lol|thanks|thx|ok|got it|nice)\b", tl) or any(k in text for k in ["收到", "謝謝", "哈哈"]):
+    if signals & _KW_CHITCHAT:
         score -= 0.25
         penalties.append("Acknowledgement/chit-chat; low reuse.")
 
     # H) Pure progress updates
-    progress_kw = any(k in tl for k in ["done", "finished", "pushed", "merged", "wip"])
-    if progress_kw and not (has_ident or has_error or is_task):
+    if signals & _KW_PROGRESS and not (has_ident or has_error or is_task):
         score -= 0.20
         penalties.append("Pure progress update; low reuse.")
 
     # I) Calendar-only items
-    meeting_kw = any(k in tl for k in ["meeting", "call"]) or any(k in text for k in ["開會", "約"])
-    time_kw = bool(re.search(r"\b\d{1,2}(am|pm)\b", tl)) or bool(re.search(r"\b\d{1,2}:\d{2}\b", tl))
-    if meeting_kw and time_kw and not (is_task or has_ident or has_error):
+    if signals & _KW_MEETING and signals & _SIG_CLOCK_TIME and not (is_task or has_ident or has_error):
         score -= 0.15
         penalties.append("Calendar-only note without lasting context.")
 
+    return _grade_result(score, reasons, penalties)
+
+
+def _grade_result(score: float, reasons: List[str], penalties: List[str]) -> GradeResult:
     score = _clamp01(score)
 
     # Mirror the rationale style of the playbook reference:
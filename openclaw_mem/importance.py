@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import math
+import time
 from typing import Any, Dict
 import unicodedata
 
@@ -37,9 +38,12 @@ _LABEL_ALIAS_TO_CANONICAL = {
 
 
 def label_from_score(score: float) -> str:
-    s = _clamp01(float(score))
+    # Same result as thresholding `_clamp01(score)`, without the call: NaN and
+    # -inf fail both comparisons, values above 1.0 still clear 0.80, and +inf
+    # (clamped to 0.0) is the one out-of-range value that needs a check.
+    s = float(score)
     if s >= 0.80:
-        return "must_remember"
+        return "must_remember" if s != math.inf else "ignore"
     if s >= 0.50:
         return "nice_to_have"
     return "ignore"
@@ -49,9 +53,13 @@ def _normalize_label(value: Any) -> str | None:
     if not isinstance(value, str):
         return None
 
+    if value in _LABEL_TO_SCORE:
+        return value
+
     # Width-normalize first so full-width variants like
     # `ＭＵＳＴ＿ＲＥＭＥＭＢＥＲ` / `ＮＩＣＥ－ＴＯ－ＨＡＶＥ` are accepted.
-    key = unicodedata.normalize("NFKC", value).strip().lower()
+    # NFKC leaves ASCII unchanged, so ASCII labels skip the call.
+    key = (value if value.isascii() else unicodedata.normalize("NFKC", value)).strip().lower()
     key = _LABEL_ALIAS_TO_CANONICAL.get(key, key)
     if key in _LABEL_TO_SCORE:
         return key
@@ -69,6 +77,18 @@ def normalize_label(value: Any) -> str | None:
 
 
 def _parse_score_like(value: Any) -> float | None:
+    # Exact-type dispatch for the JSON-decoded shapes seen on every row; only
+    # subclasses (IntEnum, numpy scalars, str subclasses) reach the isinstance
+    # ladder below. `bool` is an int subclass, so it never hits the fast path.
+    t = type(value)
+    if t is float or t is int:
+        score = float(value)
+        if math.isfinite(score):
+            return score
+        return None
+    if t is dict or value is None:
+        return None
+
     if isinstance(value, bool):
         return None
 
@@ -79,7 +99,7 @@ def _parse_score_like(value: Any) -> float | None:
         return None
 
     if isinstance(value, str):
-        normalized = unicodedata.normalize("NFKC", value).strip()
+        normalized = (value if value.isascii() else unicodedata.normalize("NFKC", value)).strip()
         if not normalized:
             return None
 
@@ -140,6 +160,24 @@ def is_parseable_importance(value: Any) -> bool:
     return False
 
 
+# (epoch second, ISO-8601 UTC string) of the last stamp handed out.
+_GRADED_AT_CACHE: list[Any] = [None, ""]
+
+
+def _graded_at_now() -> str:
+    """Return the current UTC time as second-precision ISO-8601 with a `Z` suffix.
+
+    Batch grading calls this thousands of times per second, so the formatted
+    string is reused until the wall-clock second changes.
+    """
+    now = int(time.time())
+    cache = _GRADED_AT_CACHE
+    if cache[0] != now:
+        cache[1] = datetime.fromtimestamp(now, timezone.utc).isoformat().replace("+00:00", "Z")
+        cache[0] = now
+    return cache[1]
+
+
 def make_importance(
     score: float,
     *,
@@ -158,14 +196,7 @@ def make_importance(
     normalized = _normalize_label(label)
     lab = normalized if normalized is not None else label_from_score(s)
 
-    ts = graded_at
-    if not ts:
-        ts = (
-            datetime.now(timezone.utc)
-            .replace(microsecond=0)
-            .isoformat()
-            .replace("+00:00", "Z")
-        )
+    ts = graded_at or _graded_at_now()
 
     return {
         "score": s,
@@ -10,26 +10,27 @@ Notes:
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import copy
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional
 
 PACK_TRACE_V1_KIND = "openclaw-mem.pack.trace.v1"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Version:
     openclaw_mem: str
     schema: str = "v1"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Query:
     text: str
     scope: Optional[str] = None
     intent: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Budgets:
     budgetTokens: int
     maxItems: int
@@ -37,7 +38,7 @@ class PackTraceV1Budgets:
     niceCap: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Retriever:
     kind: str
     # Optional knobs by retriever kind.
@@ -45,7 +46,7 @@ class PackTraceV1Retriever:
     k: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Lane:
     name: str
     source: str
@@ -53,13 +54,13 @@ class PackTraceV1Lane:
     retrievers: List[PackTraceV1Retriever] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1DecisionCaps:
     niceCapHit: bool
     l2CapHit: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Decision:
     included: bool
     reason: List[str]
@@ -67,20 +68,20 @@ class PackTraceV1Decision:
     caps: PackTraceV1DecisionCaps
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1CandidateScores:
     rrf: float
     fts: float
     semantic: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1CandidateCitations:
     url: Optional[str]
     recordRef: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Candidate:
     id: str
     layer: str
@@ -91,7 +92,7 @@ class PackTraceV1Candidate:
     citations: PackTraceV1CandidateCitations
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Coverage:
     rationaleMissingCount: int
     citationMissingCount: int
@@ -99,7 +100,7 @@ class PackTraceV1Coverage:
     allIncludedHaveCitations: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Output:
     includedCount: int
     excludedCount: int
@@ -109,14 +110,14 @@ class PackTraceV1Output:
     coverage: PackTraceV1Coverage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1Timing:
     durationMs: int
     stages: Dict[str, float] = field(default_factory=dict)
     total_ms: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackTraceV1:
     kind: str
     ts: str
@@ -133,6 +134,36 @@ class PackTraceV1:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
+_FIELD_NAMES: Dict[type, tuple[str, ...]] = {}
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, str})
+
+
+def _to_plain(value: Any) -> Any:
+    # Mirrors dataclasses.asdict: every container is rebuilt as its own type
+    # and non-atomic leaves are deep-copied; only immutable scalars are shared.
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    names = _FIELD_NAMES.get(type(value))
+    if names is None and hasattr(type(value), "__dataclass_fields__"):
+        names = _FIELD_NAMES[type(value)] = tuple(f.name for f in fields(value))
+    if names is not None:
+        return {name: _to_plain(getattr(value, name)) for name in names}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # namedtuple: its constructor takes positional fields, not an iterable.
+        return type(value)(*[_to_plain(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_plain(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)((_to_plain(key), _to_plain(item)) for key, item in value.items())
+    return copy.deepcopy(value)
+
+
 def to_dict(trace: PackTraceV1) -> Dict[str, Any]:
-    """Serialize the trace to plain JSON-safe types."""
-    return asdict(trace)
+    """Serialize the trace to plain JSON-safe types.
+
+    Walks the dataclass tree by attribute access instead of `dataclasses.asdict`,
+    returning immutable scalars as-is rather than deep-copying every leaf; all
+    containers are still rebuilt, so the result shares no mutable state with
+    the trace.
+    """
+    return _to_plain(trace)
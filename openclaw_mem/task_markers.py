@@ -24,6 +24,7 @@ _CLOSE_BY_OPEN = {
     "‹": "›",
     "<": ">",
 }
+_ROMAN_RE = re.compile(r"M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})")
 
 
 def _has_valid_suffix(text: str, idx: int, *, allow_compact: bool = False) -> bool:
@@ -69,10 +70,7 @@ def _is_roman_token(token: str) -> bool:
     if not token:
         return False
 
-    return re.fullmatch(
-        r"M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})",
-        token.upper(),
-    ) is not None
+    return _ROMAN_RE.fullmatch(token.upper()) is not None
 
 
 def _looks_like_checkbox_prefix(value: str) -> bool:
@@ -229,6 +227,12 @@ def summary_has_task_marker(summary: str) -> bool:
     if not s:
         return False
 
+    # Every accepted candidate is a suffix of `s` that starts with a marker
+    # (optionally bracketed), so `s` must contain one; most summaries don't.
+    up = s.upper()
+    if not any(marker in up for marker in _MARKERS):
+        return False
+
     candidates = [s]
     stripped = strip_markdown_task_prefix(s)
     if stripped and stripped != s:
@@ -12,14 +12,27 @@ from __future__ import annotations
 
 import heapq
 import math
+import operator
 from array import array
 from typing import Iterable, List, Sequence, Tuple, Dict
 
 
 def pack_f32(vec: Sequence[float]) -> bytes:
-    """Pack float vector into float32 bytes."""
-    arr = array("f", vec)
-    return arr.tobytes()
+    """Pack float vector into float32 bytes.
+
+    Inputs that already expose a contiguous float32 buffer (``array("f")``,
+    float32 NumPy arrays) are copied out as-is instead of being re-converted
+    element by element.
+    """
+    if not isinstance(vec, (list, tuple)):
+        try:
+            view = memoryview(vec)
+        except TypeError:
+            pass
+        else:
+            if view.format == "f" and view.ndim == 1 and view.c_contiguous:
+                return view.tobytes()
+    return array("f", vec).tobytes()
 
 
 def unpack_f32(blob: bytes) -> List[float]:
@@ -30,11 +43,23 @@ def unpack_f32(blob: bytes) -> List[float]:
 
 
 def l2_norm(vec: Sequence[float]) -> float:
-    return math.sqrt(sum((x * x) for x in vec))
+    # math.hypot is the one norm routine used for stored and query vectors
+    # alike, so both sides of a cosine score round the same way.
+    return math.hypot(*vec)
+
+
+def pack_f32_with_norm(vec: Sequence[float]) -> Tuple[bytes, float]:
+    """Return ``(pack_f32(vec), l2_norm(vec))`` for an embedding being stored.
+
+    Materializes ``vec`` once so generators and other one-shot iterables can
+    feed both the packing and the norm.
+    """
+    values = vec if isinstance(vec, (list, tuple)) else list(vec)
+    return array("f", values).tobytes(), l2_norm(values)
 
 
 def dot(a: Sequence[float], b: Sequence[float]) -> float:
-    return sum((x * y) for x, y in zip(a, b))
+    return sum(map(operator.mul, a, b))
 
 
 def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
@@ -60,6 +85,11 @@ def rank_cosine(
     ``limit`` rows while scanning, avoiding a full scored list/full sort for
     bounded retrieval. Non-finite query norms, vector norms, or scores are
     skipped, and non-positive limits return an empty result.
+
+    This is the dependency-free scan; the NumPy and sqlite-vec backends in
+    ``openclaw_mem.core.vector_index`` cover batched matrix scoring. Blobs are
+    scored straight from a float32 ``array`` with a C-level multiply/sum, so
+    scores match the element-wise Python loop exactly.
     """
     q = list(query_vec)
     qn = l2_norm(q)
@@ -67,24 +97,25 @@ def rank_cosine(
         return []
 
     top: List[Tuple[float, int, int]] = []
-    q_dim = len(q)
+    blob_size = len(q) * 4
     for seq, (obs_id, blob, norm) in enumerate(items):
         if not blob or not norm:
             continue
         if norm == 0.0 or not math.isfinite(norm):
             continue
 
+        # Skip stale/mismatched embeddings (and malformed blobs) by byte length
+        # before decoding anything.
+        if len(blob) != blob_size:
+            continue
         try:
-            v = unpack_f32(blob)
+            v = array("f")
+            v.frombytes(blob)
         except Exception:
-            # Skip malformed blobs instead of failing vector retrieval.
-            continue
-
-        if len(v) != q_dim:
-            # Skip stale/mismatched embeddings to prevent invalid comparisons.
+            # Skip non-bytes blobs instead of failing vector retrieval.
             continue
 
-        s = dot(q, v) / (qn * norm)
+        s = sum(map(operator.mul, q, v)) / (qn * norm)
         score = float(s)
         if not math.isfinite(score):
             # Non-finite scores cannot be ordered safely in the bounded heap.
@@ -112,12 +143,22 @@ def rank_rrf(
     """
     scores: Dict[int, float] = {}
 
+    # RRF score = 1 / (k + rank + 1) with 0-indexed ranks. The weight depends
+    # only on the rank, so every lane shares one precomputed table.
+    longest = max((len(ranking) for ranking in ranked_lists), default=0)
+    weights = [1.0 / (k + rank + 1) for rank in range(longest)]
+    get = scores.get
     for ranking in ranked_lists:
-        for rank, item_id in enumerate(ranking):
-            # RRF score = 1 / (k + rank)
-            # rank is 0-indexed here
-            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank + 1)
-
-    # Sort deterministically: score desc, then id asc for stable ties.
-    sorted_items = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
-    return sorted_items[:limit]
+        for item_id, weight in zip(ranking, weights):
+            scores[item_id] = get(item_id, 0.0) + weight
+
+    # Order deterministically: score desc, then id asc for stable ties. Only the
+    # top `limit` entries are needed, so select them with a bounded heap
+    # (equivalent to sorted(...)[:limit]) instead of sorting every fused id.
+    def order(x: Tuple[int, float]) -> Tuple[float, int]:
+        return (-x[1], x[0])
+
+    if limit < 0:
+        # Keep the historical slice semantics for negative limits.
+        return sorted(scores.items(), key=order)[:limit]
+    return heapq.nsmallest(limit, scores.items(), key=order)
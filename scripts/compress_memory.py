@@ -8,15 +8,32 @@ Defaults to yesterday's date if no argument provided.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http.client
 import json
+import mmap
 import os
+import re
+import shutil
 import sys
 import tempfile
+import threading
+import time
+import urllib.parse
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional; the stdlib codec is always available
+    _orjson = None
+
+
+DEFAULT_JOBS = 4
 
 
 class CompressError(Exception):
@@ -24,16 +41,159 @@ class CompressError(Exception):
     pass
 
 
-class OpenAIClient:
-    """Abstraction for OpenAI API calls (mockable for tests)."""
+def _dumps_bytes(payload: dict) -> bytes:
+    """Serialize a request payload straight to UTF-8 JSON bytes."""
+    if _orjson is not None:
+        return _orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads_bytes(raw: bytes):
+    """Decode a JSON response body, preferring orjson when installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
-    def __init__(self, api_key: str, base_url: str = "https://api.openai.com/v1", extra_headers: Optional[dict[str, str]] = None):
+class OpenAIClient:
+    """Abstraction for OpenAI API calls (mockable for tests).
+
+    Keeps one keep-alive HTTP(S) connection per client so repeated calls skip
+    the TCP/TLS handshake. When the environment routes the host through a
+    proxy, requests go through ``urllib`` so proxy settings keep applying.
+    """
+
+    _TIMEOUT = 120
+    _RETRIES = 3
+    _RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    _BACKOFF_SECONDS = 0.5
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        extra_headers: Optional[dict[str, str]] = None,
+        cache_dir: Optional[Path] = None,
+        force_refresh: bool = False,
+    ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.extra_headers = extra_headers or {}
+        # Optional on-disk response cache; `force_refresh` skips lookups but
+        # still records fresh responses.
+        self.cache_dir = cache_dir
+        self.force_refresh = force_refresh
+        self._url = self.base_url + "/chat/completions"
+        self._split = urllib.parse.urlsplit(self._url)
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def _cache_path(self, prompt: str, model: str, max_tokens: int, temperature: float) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = json.dumps([self.base_url, model, max_tokens, temperature, prompt], ensure_ascii=False)
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    @staticmethod
+    def _read_cached(path: Path) -> Optional[str]:
+        try:
+            content = _loads_bytes(path.read_bytes()).get("content")
+        except (OSError, ValueError, AttributeError):
+            return None
+        return content if isinstance(content, str) and content else None
+
+    @staticmethod
+    def _write_cached(path: Path, content: str, model: str) -> None:
+        record = {"content": content, "model": model, "ts": datetime.now().astimezone().isoformat(timespec="seconds")}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                tmp.write(_dumps_bytes(record))
+            os.replace(tmp.name, path)
+        except OSError:
+            # The cache is best-effort; a failed write must not fail the run.
+            pass
+
+    def _direct(self) -> bool:
+        split = self._split
+        if split.scheme not in ("http", "https") or not split.hostname:
+            return False
+        if split.scheme not in urllib.request.getproxies():
+            return True
+        return bool(urllib.request.proxy_bypass(split.hostname))
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            split = self._split
+            conn_cls = http.client.HTTPSConnection if split.scheme == "https" else http.client.HTTPConnection
+            self._conn = conn_cls(split.hostname, split.port, timeout=self._TIMEOUT)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _post_direct(self, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        split = self._split
+        path = split.path or "/"
+        if split.query:
+            path += "?" + split.query
+        headers = {**headers, "Connection": "keep-alive"}
+        for attempt in (0, 1):
+            reused = self._conn is not None
+            conn = self._connection()
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server dropped an idle keep-alive socket; retry once fresh.
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                self.close()
+                raise
+            if resp.will_close:
+                self.close()
+            return resp.status, raw
+        raise AssertionError("unreachable")
+
+    def _post_once(self, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        if self._direct():
+            return self._post_direct(body, headers)
+
+        req = urllib.request.Request(self._url, data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=self._TIMEOUT) as resp:
+                return resp.status, resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def _post(self, body: bytes, headers: dict[str, str]) -> bytes:
+        # Rate limits and transient gateway errors are retried with
+        # exponential backoff (0.5s, 1s, 2s) before giving up.
+        for attempt in range(self._RETRIES + 1):
+            status, raw = self._post_once(body, headers)
+            if status not in self._RETRY_STATUSES or attempt == self._RETRIES:
+                break
+            time.sleep(self._BACKOFF_SECONDS * (2 ** attempt))
+        if status >= 400:
+            err_body = raw.decode("utf-8", errors="replace")
+            raise CompressError(f"OpenAI API error ({status}): {err_body}")
+        return raw
 
     def complete(self, prompt: str, model: str, max_tokens: int, temperature: float) -> str:
-        url = self.base_url + "/chat/completions"
+        cache_path = self._cache_path(prompt, model, max_tokens, temperature)
+        if cache_path is not None and not self.force_refresh:
+            cached = self._read_cached(cache_path)
+            if cached is not None:
+                return cached
+
         payload = {
             "model": model,
             "messages": [
@@ -50,31 +210,25 @@ class OpenAIClient:
         }
         headers.update(self.extra_headers)
 
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers=headers,
-            method="POST",
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
-                body = resp.read().decode("utf-8")
-        except urllib.error.HTTPError as e:
-            err_body = e.read().decode("utf-8", errors="replace")
-            raise CompressError(f"OpenAI API error ({e.code}): {err_body}") from e
+            raw = self._post(_dumps_bytes(payload), headers)
+        except CompressError:
+            raise
         except Exception as e:
             raise CompressError(f"Error calling OpenAI API: {e}") from e
 
         try:
-            data = json.loads(body)
+            data = _loads_bytes(raw)
             content = data["choices"][0]["message"]["content"].strip()
         except Exception as e:
+            body = raw.decode("utf-8", errors="replace")
             raise CompressError(f"Error parsing OpenAI response: {e}\\n{body[:2000]}") from e
 
         if not content:
             raise CompressError("Empty summary returned from API")
 
+        if cache_path is not None:
+            self._write_cached(cache_path, content, model)
         return content
 
 
@@ -87,42 +241,109 @@ def validate_date(date_str: str) -> str:
         raise CompressError(f"Invalid date format '{date_str}': expected YYYY-MM-DD") from e
 
 
+def date_range(start: str, end: str) -> list[str]:
+    """Return every date from ``start`` to ``end`` inclusive (YYYY-MM-DD)."""
+    first = datetime.strptime(validate_date(start), "%Y-%m-%d")
+    last = datetime.strptime(validate_date(end), "%Y-%m-%d")
+    if last < first:
+        raise CompressError(f"Invalid date range: {end} is before {start}")
+    return [(first + timedelta(days=i)).strftime("%Y-%m-%d") for i in range((last - first).days + 1)]
+
+
+def read_dates_file(path: Path) -> list[str]:
+    """Read dates from a file, one per line; blank lines and ``#`` comments are ignored."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise CompressError(f"Cannot read dates file {path}: {e}") from e
+    return [validate_date(s) for s in (ln.split("#", 1)[0].strip() for ln in lines) if s]
+
+
 def atomic_append(file_path: Path, content: str) -> None:
-    """Append content to file atomically (write-to-temp + rename)."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    """Append content to file atomically (write-to-temp + rename).
 
-    # Read existing content
-    existing = file_path.read_text(encoding="utf-8") if file_path.exists() else ""
+    The existing file is streamed into the temp file in 1 MiB blocks rather
+    than read into memory, so appends cost O(block) memory however large
+    MEMORY.md grows.
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write combined content to temp file
     with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
+        mode="wb",
         dir=file_path.parent,
         delete=False,
         prefix=".tmp_",
         suffix=".md",
     ) as tmp:
-        tmp.write(existing + content)
+        if file_path.exists():
+            with file_path.open("rb") as src:
+                shutil.copyfileobj(src, tmp, 1 << 20)
+        tmp.write(content.encode("utf-8"))
         tmp_path = Path(tmp.name)
 
     # Atomic rename
     tmp_path.replace(file_path)
 
 
-def compress_daily_note(
-    date: str,
+_NON_WHITESPACE_RE = re.compile(r"\S")
+
+
+def _read_text_bytes(path: Path) -> bytes:
+    """Read a UTF-8 text file as bytes with universal newlines applied.
+
+    Matches the newline translation of ``Path.read_text`` so callers can join
+    and decode the raw bytes themselves.
+    """
+    data = path.read_bytes()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+def _file_contains(path: Path, needle: str) -> bool:
+    """Search a file for ``needle`` without reading or decoding it whole.
+
+    The file is memory-mapped so pages load lazily, and the UTF-8 encoded
+    needle is matched bytewise (UTF-8 is self-synchronizing, so a byte match
+    is a text match).
+    """
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle.encode("utf-8")) != -1
+
+
+_SUMMARY_HEADER_RE = re.compile(rb"## (\d{4}-\d{2}-\d{2}) Summary")
+
+
+def _summarized_dates(path: Path) -> set[str]:
+    """Dates that already have a ``## <date> Summary`` header in ``path``.
+
+    One scan of MEMORY.md replaces a per-date search when backfilling many
+    dates; like `_file_contains`, a header anywhere in the file counts.
+    """
+    if not path.exists():
+        return set()
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return set()
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {m.decode("ascii") for m in _SUMMARY_HEADER_RE.findall(mm)}
+
+
+def _prepare_daily_note(
+    target_date: str,
     memory_dir: Path,
     memory_file: Path,
     prompt_file: Path,
-    client: OpenAIClient,
-    model: str,
-    max_tokens: int,
-    temperature: float,
-    dry_run: bool = False,
-) -> dict:
-    """Compress a daily note and optionally append to MEMORY.md."""
-    target_date = validate_date(date)
+    summarized: set[str] | None = None,
+) -> dict | str:
+    """Return the full prompt for ``target_date``, or a skip result dict.
+
+    ``summarized`` is a precomputed `_summarized_dates` set; without it
+    MEMORY.md is searched for this date alone.
+    """
     target_file = memory_dir / f"{target_date}.md"
 
     if not target_file.exists():
@@ -134,21 +355,31 @@ def compress_daily_note(
         }
 
     # Check if already summarized
-    if memory_file.exists():
-        mem_content = memory_file.read_text(encoding="utf-8")
-        if f"## {target_date} Summary" in mem_content:
-            return {
-                "ok": True,
-                "skipped": True,
-                "reason": f"{target_date} already appears in {memory_file}",
-                "date": target_date,
-            }
+    if summarized is not None:
+        already = target_date in summarized
+    else:
+        already = memory_file.exists() and _file_contains(memory_file, f"## {target_date} Summary")
+    if already:
+        return {
+            "ok": True,
+            "skipped": True,
+            "reason": f"{target_date} already appears in {memory_file}",
+            "date": target_date,
+        }
 
     if not prompt_file.exists():
         raise CompressError(f"Prompt file missing at {prompt_file}")
 
-    daily_content = target_file.read_text(encoding="utf-8")
-    if not daily_content.strip():
+    # Join the raw bytes and decode the combined prompt in one pass, rather
+    # than decoding each file and copying both again into a new string. Only
+    # the (short) prompt template is measured separately to locate the note.
+    base_bytes = _read_text_bytes(prompt_file)
+    daily_bytes = _read_text_bytes(target_file)
+    intro = f"\\n\\n# Daily Notes ({target_date})\\n"
+    full_prompt = b"".join((base_bytes, intro.encode("utf-8"), daily_bytes)).decode("utf-8")
+    base_len = len(base_bytes) if base_bytes.isascii() else len(base_bytes.decode("utf-8"))
+    daily_start = base_len + len(intro)
+    if _NON_WHITESPACE_RE.search(full_prompt, daily_start) is None:
         return {
             "ok": True,
             "skipped": True,
@@ -156,11 +387,21 @@ def compress_daily_note(
             "date": target_date,
         }
 
-    base_prompt = prompt_file.read_text(encoding="utf-8")
-    full_prompt = f"{base_prompt}\\n\\n# Daily Notes ({target_date})\\n{daily_content}"
+    return full_prompt
+
 
-    summary = client.complete(full_prompt, model, max_tokens, temperature)
+def _finish_daily_note(
+    target_date: str,
+    summary: str,
+    memory_file: Path,
+    dry_run: bool,
+    collected: Optional[list[str]] = None,
+) -> dict:
+    """Append (or, in dry-run mode, just report) the summary for ``target_date``.
 
+    With ``collected``, the entry is added to that list instead of being
+    written, so a batch can append all of its entries in one rewrite.
+    """
     header = f"## {target_date} Summary"
     entry = f"\\n\\n{header}\\n{summary}"
 
@@ -172,7 +413,10 @@ def compress_daily_note(
             "summary": summary,
         }
 
-    atomic_append(memory_file, entry)
+    if collected is None:
+        atomic_append(memory_file, entry)
+    else:
+        collected.append(entry)
 
     return {
         "ok": True,
@@ -183,6 +427,105 @@ def compress_daily_note(
     }
 
 
+def compress_daily_note(
+    date: str,
+    memory_dir: Path,
+    memory_file: Path,
+    prompt_file: Path,
+    client: OpenAIClient,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    dry_run: bool = False,
+) -> dict:
+    """Compress a daily note and optionally append to MEMORY.md."""
+    target_date = validate_date(date)
+    prepared = _prepare_daily_note(target_date, memory_dir, memory_file, prompt_file)
+    if isinstance(prepared, dict):
+        return prepared
+
+    summary = client.complete(prepared, model, max_tokens, temperature)
+    return _finish_daily_note(target_date, summary, memory_file, dry_run)
+
+
+def compress_daily_notes(
+    dates: list[str],
+    memory_dir: Path,
+    memory_file: Path,
+    prompt_file: Path,
+    client_factory: Callable[[], OpenAIClient],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    dry_run: bool = False,
+    jobs: int = DEFAULT_JOBS,
+) -> list[dict]:
+    """Compress several daily notes, overlapping the API calls.
+
+    Prompts are prepared up front (MEMORY.md is scanned once for dates that
+    are already summarized), up to ``jobs`` completions run concurrently
+    (one client per worker thread), and the new summaries are appended to
+    MEMORY.md in one `atomic_append` once all completions are in, since each
+    append rewrites the whole file. Entries keep the order of ``dates``.
+    A failed completion is reported as ``{"ok": False, ...}`` for that date
+    without aborting the others. Results follow the order of ``dates``.
+    """
+    targets = list(dict.fromkeys(validate_date(d) for d in dates))
+    results: dict[str, dict] = {}
+    pending: list[tuple[str, str]] = []
+    summarized = _summarized_dates(memory_file)
+    for target_date in targets:
+        prepared = _prepare_daily_note(target_date, memory_dir, memory_file, prompt_file, summarized)
+        if isinstance(prepared, dict):
+            results[target_date] = prepared
+        else:
+            pending.append((target_date, prepared))
+
+    local = threading.local()
+    clients: list[OpenAIClient] = []
+    entries: list[str] = []
+
+    def summarize(prompt: str) -> str:
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = client_factory()
+            clients.append(client)
+        return client.complete(prompt, model, max_tokens, temperature)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending) or 1))) as pool:
+            futures = [(target_date, pool.submit(summarize, prompt)) for target_date, prompt in pending]
+            for target_date, future in futures:
+                try:
+                    summary = future.result()
+                except CompressError as e:
+                    results[target_date] = {"ok": False, "date": target_date, "error": str(e)}
+                    continue
+                results[target_date] = _finish_daily_note(target_date, summary, memory_file, dry_run, entries)
+        if entries:
+            atomic_append(memory_file, "".join(entries))
+    finally:
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is not None:
+                close()
+
+    return [results[target_date] for target_date in targets]
+
+
+def _print_result(result: dict) -> None:
+    if not result.get("ok", True):
+        print(f"Error ({result['date']}): {result['error']}", file=sys.stderr)
+    elif result.get("skipped"):
+        print(f"Skipping: {result['reason']}")
+    elif result.get("dry_run"):
+        print("--- DRY RUN OUTPUT ---")
+        print(f"\\n\\n## {result['date']} Summary")
+        print(result['summary'])
+    else:
+        print(f"✅ Appended summary to {result['memory_file']}")
+
+
 def main() -> None:
     # Configuration defaults (overridable via env vars)
     workspace = Path(os.environ.get("OPENCLAW_MEM_WORKSPACE", Path(__file__).resolve().parents[1]))
@@ -205,6 +548,13 @@ Examples:
   # Compress specific date
   python scripts/compress_memory.py 2026-02-04
 
+  # Backfill several dates, with up to 4 API calls in flight
+  python scripts/compress_memory.py 2026-02-01 2026-02-02 2026-02-03 --jobs 4
+
+  # Backfill a whole month, or the dates listed in a file (one per line)
+  python scripts/compress_memory.py --date-range 2026-01-01 2026-01-31
+  python scripts/compress_memory.py --dates-from dates.txt
+
   # Dry run (don't write)
   python scripts/compress_memory.py --dry-run --json
 
@@ -213,9 +563,12 @@ Environment variables:
   OPENCLAW_MEM_WORKSPACE Workspace root (default: repo root)
   OPENCLAW_MEM_MODEL     Model name (default: gpt-4.1)
   OPENAI_BASE_URL        API base URL (default: https://api.openai.com/v1)
+  OPENCLAW_MEM_CACHE     Set to 1/true/yes/on to cache API responses under <workspace>/.cache/openai
         """,
     )
-    parser.add_argument("date", nargs="?", help="Date to process (YYYY-MM-DD)", default=None)
+    parser.add_argument("dates", nargs="*", metavar="date", help="Date(s) to process (YYYY-MM-DD); defaults to yesterday")
+    parser.add_argument("--date-range", nargs=2, metavar=("START", "END"), help="Process every date from START to END (inclusive)")
+    parser.add_argument("--dates-from", type=Path, metavar="FILE", help="Process the dates listed in FILE, one per line")
     parser.add_argument("--dry-run", action="store_true", help="Print summary without writing")
     parser.add_argument("--model", default=default_model, help="OpenAI model")
     parser.add_argument("--base-url", default=default_base_url, help="OpenAI API base URL")
@@ -224,15 +577,11 @@ Environment variables:
     parser.add_argument("--memory-dir", type=Path, default=default_memory_dir, help="Memory directory")
     parser.add_argument("--memory-file", type=Path, default=default_memory_file, help="MEMORY.md path")
     parser.add_argument("--prompt-file", type=Path, default=default_prompt_file, help="Prompt file path")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Concurrent API calls when several dates are given")
+    parser.add_argument("--force-refresh", action="store_true", help="Ignore cached API responses (OPENCLAW_MEM_CACHE=1)")
     parser.add_argument("--json", action="store_true", help="Output structured JSON")
     args = parser.parse_args()
 
-    # Determine target date
-    if args.date:
-        target_date = args.date
-    else:
-        target_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-
     # Get API key
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
@@ -240,34 +589,60 @@ Environment variables:
         print("Hint: export OPENAI_API_KEY=sk-...", file=sys.stderr)
         sys.exit(1)
 
-    # Create client
-    client = OpenAIClient(api_key, args.base_url)
+    use_cache = str(os.environ.get("OPENCLAW_MEM_CACHE") or "").strip().lower() in {"1", "true", "yes", "on"}
+    cache_dir = workspace / ".cache" / "openai" if use_cache else None
+
+    def make_client() -> OpenAIClient:
+        return OpenAIClient(api_key, args.base_url, cache_dir=cache_dir, force_refresh=args.force_refresh)
 
     # Run compression
     try:
-        result = compress_daily_note(
-            date=target_date,
-            memory_dir=args.memory_dir,
-            memory_file=args.memory_file,
-            prompt_file=args.prompt_file,
-            client=client,
-            model=args.model,
-            max_tokens=args.max_tokens,
-            temperature=args.temperature,
-            dry_run=args.dry_run,
-        )
+        # Determine target date(s)
+        dates = list(args.dates)
+        if args.date_range:
+            dates += date_range(*args.date_range)
+        if args.dates_from:
+            dates += read_dates_file(args.dates_from)
+        if not (args.dates or args.date_range or args.dates_from):
+            dates = [(datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")]
+
+        if len(dates) == 1:
+            result = compress_daily_note(
+                date=dates[0],
+                memory_dir=args.memory_dir,
+                memory_file=args.memory_file,
+                prompt_file=args.prompt_file,
+                client=make_client(),
+                model=args.model,
+                max_tokens=args.max_tokens,
+                temperature=args.temperature,
+                dry_run=args.dry_run,
+            )
+            results = [result]
+            output: object = result
+        else:
+            results = compress_daily_notes(
+                dates,
+                memory_dir=args.memory_dir,
+                memory_file=args.memory_file,
+                prompt_file=args.prompt_file,
+                client_factory=make_client,
+                model=args.model,
+                max_tokens=args.max_tokens,
+                temperature=args.temperature,
+                dry_run=args.dry_run,
+                jobs=args.jobs,
+            )
+            output = results
 
         if args.json:
-            print(json.dumps(result, ensure_ascii=False, indent=2))
+            print(json.dumps(output, ensure_ascii=False, indent=2))
         else:
-            if result.get("skipped"):
-                print(f"Skipping: {result['reason']}")
-            elif result.get("dry_run"):
-                print("--- DRY RUN OUTPUT ---")
-                print(f"\\n\\n## {result['date']} Summary")
-                print(result['summary'])
-            else:
-                print(f"✅ Appended summary to {result['memory_file']}")
+            for result in results:
+                _print_result(result)
+
+        if not all(result.get("ok", True) for result in results):
+            sys.exit(1)
 
     except CompressError as e:
         print(f"Error: {e}", file=sys.stderr)
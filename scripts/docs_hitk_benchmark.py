@@ -12,28 +12,28 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
-def _run_search(db: str, query: str, top_k: int) -> List[Dict[str, Any]]:
-    cmd = [
-        "openclaw-mem",
-        "--db",
-        db,
-        "docs",
-        "search",
-        query,
-        "--limit",
-        str(top_k),
-        "--json",
-    ]
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    if p.returncode != 0:
-        raise RuntimeError((p.stderr or p.stdout or "docs search failed").strip())
-    payload = json.loads(p.stdout or "{}")
+from openclaw_mem.cli import _close_connection, _connect, _docs_search_payload, build_parser  # noqa: E402
+from openclaw_mem.core import jsonio  # noqa: E402
+
+
+def _run_search(db: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    # sqlite3 connections stay on the thread that opened them, so each search
+    # opens its own.
+    conn = _connect(db)
+    try:
+        payload = _docs_search_payload(conn, args, args.query)
+    finally:
+        _close_connection(conn)
     return list(payload.get("results") or [])
 
 
@@ -57,6 +57,12 @@ def main() -> int:
     ap.add_argument("--db", required=True, help="SQLite DB path")
     ap.add_argument("--queries", required=True, help="JSONL file path")
     ap.add_argument("--k-per-query", type=int, default=5, help="Top-K used when row has no explicit k (default: 5)")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Queries searched concurrently (default: min(4, CPUs))",
+    )
     args = ap.parse_args()
 
     qpath = Path(args.queries)
@@ -71,7 +77,7 @@ def main() -> int:
             if not s:
                 continue
             try:
-                obj = json.loads(s)
+                obj = jsonio.loads(s)
             except Exception as e:
                 print(json.dumps({"error": "invalid jsonl", "line": line_no, "detail": str(e)}, ensure_ascii=False), file=sys.stderr)
                 return 2
@@ -81,10 +87,10 @@ def main() -> int:
         print(json.dumps({"error": "empty query set"}, ensure_ascii=False), file=sys.stderr)
         return 2
 
-    total = 0
-    hit = 0
-    details = []
-
+    # Same flags and defaults as `openclaw-mem docs search --json`, parsed up
+    # front; the searches then run in-process instead of a CLI process each.
+    parser = build_parser(only=["docs"])
+    jobs = []
     for i, row in enumerate(rows, start=1):
         q = str(row.get("query") or "").strip()
         expects = row.get("expects") or []
@@ -96,8 +102,21 @@ def main() -> int:
 
         top_k = int(row.get("k") or args.k_per_query)
         top_k = max(1, top_k)
+        search_args = parser.parse_args(["docs", "search", q, "--limit", str(top_k), "--json"])
+        jobs.append((i, q, expects, top_k, search_args))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(jobs)))) as pool:
+            all_results = list(pool.map(lambda job: _run_search(args.db, job[4]), jobs))
+    except Exception as e:
+        print(json.dumps({"error": "docs search failed", "detail": str(e) or type(e).__name__}, ensure_ascii=False), file=sys.stderr)
+        return 1
+
+    total = 0
+    hit = 0
+    details = []
 
-        results = _run_search(args.db, q, top_k)
+    for (i, q, expects, top_k, _), results in zip(jobs, all_results):
         ok = any(_matches(exp, results) for exp in expects)
 
         total += 1
@@ -32,16 +32,21 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import mmap
+import os
 import re
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 LINE_RE = re.compile(
     r"^\s*-\s*\[(?P<cat>[A-Z]+)\]\s+(?P<text>.+?)\s+\(importance:\s*(?P<imp>[0-9]*\.?[0-9]+)\)\s*$"
 )
 WIKILINK_RE = re.compile(r"\[\[(.+?)\]\]")
+IMPORTANCE_MARKER = b"(importance:"  # literal required by LINE_RE
 
 
 @dataclass(frozen=True)
@@ -52,44 +57,88 @@ class DurableItem:
     text: str
     item_id: str  # stable short hash
 
+    @cached_property
+    def title(self) -> str:
+        # Rendered on the item note, its category page and possibly the hub;
+        # computed once per item.
+        return _title_from_text(self.text)
+
 
 def _sha12(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()[:12]
 
 
 def _iter_daily_files(memory_dir: Path) -> Iterable[Path]:
-    for p in sorted(memory_dir.glob("????-??-??.md")):
-        yield p
-
-
-def _parse_items_from_file(p: Path) -> list[DurableItem]:
+    # Same names as glob("????-??-??.md"), via one scandir pass and plain
+    # string checks; sorting names equals sorting the sibling paths.
+    with os.scandir(memory_dir) as it:
+        names = [
+            e.name
+            for e in it
+            if len(e.name) == 13 and e.name.endswith(".md") and e.name[4] == "-" and e.name[7] == "-"
+        ]
+    names.sort()
+    for name in names:
+        yield memory_dir / name
+
+
+def _parse_items_from_file(p: Path) -> Iterator[DurableItem]:
     date = p.stem
-    items: list[DurableItem] = []
-    for raw in p.read_text(encoding="utf-8").splitlines():
-        m = LINE_RE.match(raw)
-        if not m:
-            continue
-        cat = m.group("cat").strip().lower()
-        text = m.group("text").strip()
-        imp = float(m.group("imp"))
-        item_id = _sha12(f"{date}|{cat}|{imp:.6f}|{text}")
-        items.append(DurableItem(date=date, category=cat, importance=imp, text=text, item_id=item_id))
-    return items
-
-
-def _write(p: Path, s: str) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(s, encoding="utf-8")
+    # Daily files can be large and log-heavy, so memory-map them and let
+    # mmap.find() jump between lines containing the literal "(importance:"
+    # every durable line carries; only those lines are decoded. Each one is
+    # re-split with splitlines() and matched with LINE_RE as before, which
+    # keeps text-mode semantics (CRLF/CR newlines, Unicode whitespace).
+    with p.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(IMPORTANCE_MARKER)
+            while pos != -1:
+                start = mm.rfind(b"\n", 0, pos) + 1
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = len(mm)
+                for raw in mm[start:end].decode("utf-8").splitlines():
+                    m = LINE_RE.match(raw)
+                    if not m:
+                        continue
+                    cat = m.group("cat").strip().lower()
+                    text = m.group("text").strip()
+                    imp = float(m.group("imp"))
+                    item_id = _sha12(f"{date}|{cat}|{imp:.6f}|{text}")
+                    yield DurableItem(date=date, category=cat, importance=imp, text=text, item_id=item_id)
+                pos = mm.find(IMPORTANCE_MARKER, end)
+
+
+def _write(p: Path, s: str) -> bool:
+    """Write `s` to `p` unless the file already holds exactly that content.
+
+    Re-runs regenerate every note, so comparing first (size, then bytes)
+    turns an unchanged graph into reads only. Returns whether it wrote.
+    """
+    if os.linesep != "\n":
+        s = s.replace("\n", os.linesep)  # same bytes `write_text` would produce
+    data = s.encode("utf-8")
+    try:
+        if p.stat().st_size == len(data) and p.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(data)
+    return True
 
 
 def _title_from_text(text: str, max_len: int = 70) -> str:
-    t = re.sub(r"\s+", " ", text).strip()
+    # Same as re.sub(r"\s+", " ", text).strip(): both use str.isspace().
+    t = " ".join(text.split())
     return (t[: max_len - 1] + "…") if len(t) > max_len else t
 
 
 def _render_item_note(it: DurableItem) -> str:
-    title = _title_from_text(it.text)
-    links = sorted(set(WIKILINK_RE.findall(it.text)))
+    title = it.title
+    # Most memories carry no wiki links; skip the regex unless one can match.
+    links = sorted(set(WIKILINK_RE.findall(it.text))) if "[[" in it.text else []
     link_lines = "\n".join([f"- [[{x}]]" for x in links]) if links else "- (none)"
 
     return (
@@ -128,20 +177,21 @@ def _render_category_note(cat: str, items: list[DurableItem]) -> str:
         "## Items\n\n",
     ]
     for it in items:
-        title = _title_from_text(it.text)
-        lines.append(f"- {it.date} · {it.importance:.2f} · [[items/{it.date}/{it.item_id}|{title}]]\n")
+        lines.append(f"- {it.date} · {it.importance:.2f} · [[items/{it.date}/{it.item_id}|{it.title}]]\n")
     return "".join(lines)
 
 
-def _render_hub(items: list[DurableItem]) -> str:
-    from collections import defaultdict
-
+def _group_items(items: Iterable[DurableItem]) -> tuple[dict[str, list[DurableItem]], dict[str, list[DurableItem]]]:
+    """Group items by category and by date in a single pass."""
     by_cat: dict[str, list[DurableItem]] = defaultdict(list)
     by_date: dict[str, list[DurableItem]] = defaultdict(list)
     for it in items:
         by_cat[it.category].append(it)
         by_date[it.date].append(it)
+    return by_cat, by_date
 
+
+def _render_hub(by_cat: dict[str, list[DurableItem]], by_date: dict[str, list[DurableItem]]) -> str:
     cats = sorted(by_cat.keys())
     dates = sorted(by_date.keys(), reverse=True)
 
@@ -159,8 +209,7 @@ def _render_hub(items: list[DurableItem]) -> str:
         day_items = sorted(by_date[d], key=lambda x: (-x.importance, x.item_id))
         lines.append(f"- {d} ({len(day_items)})\n")
         for it in day_items[:5]:
-            title = _title_from_text(it.text)
-            lines.append(f"  - {it.importance:.2f} · [[items/{it.date}/{it.item_id}|{title}]]\n")
+            lines.append(f"  - {it.importance:.2f} · [[items/{it.date}/{it.item_id}|{it.title}]]\n")
 
     lines += [
         "\n## Notes\n\n",
@@ -198,24 +247,21 @@ def main() -> None:
     )
 
     # Write item notes
+    written = 0
     for it in items:
         p = items_dir / it.date / f"{it.item_id}.md"
-        _write(p, _render_item_note(it))
+        written += _write(p, _render_item_note(it))
 
     # Write categories
-    from collections import defaultdict
-
-    by_cat: dict[str, list[DurableItem]] = defaultdict(list)
-    for it in items:
-        by_cat[it.category].append(it)
-
+    by_cat, by_date = _group_items(items)
     for cat, cat_items in by_cat.items():
-        _write(out / f"Category-{cat}.md", _render_category_note(cat, cat_items))
+        written += _write(out / f"Category-{cat}.md", _render_category_note(cat, cat_items))
 
     # Write hub
-    _write(out / "DurableHub.md", _render_hub(items))
+    written += _write(out / "DurableHub.md", _render_hub(by_cat, by_date))
 
-    print(f"ok: durable graph written to {out}")
+    total = len(items) + len(by_cat) + 1
+    print(f"ok: durable graph written to {out} ({written} updated, {total - written} unchanged)")
 
 
 if __name__ == "__main__":
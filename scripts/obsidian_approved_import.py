@@ -4,8 +4,8 @@
 Minimal closed loop (v0):
 - Human approves items by adding bullet lines to a shared vault file:
   OpenClaw/Approved/approved_memories.md
-- This script reads the `## Queue` section, stores each item via `openclaw-mem store`,
-  and moves successfully processed items to `## Done`.
+- This script reads the `## Queue` section, stores each item via `openclaw-mem store`
+  (run in-process), and moves successfully processed items to `## Done`.
 
 Design goals:
 - Deterministic/idempotent: keeps state under OpenClaw/.agent_state/
@@ -20,19 +20,60 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import io
 import json
 import re
-import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from openclaw_mem.core.jsonio import loads  # noqa: E402
+
 
 QUEUE_HDR = "## Queue"
 DONE_HDR = "## Done"
 
+# Characters str.splitlines() breaks on (all of them are also whitespace).
+_LINE_SEPS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_REST_RE = re.compile(rf"[^\S{_LINE_SEPS}]*(?:[{_LINE_SEPS}]|$)")
+
+
+def _find_header(md: str, hdr: str) -> int | None:
+    """Offset of the first line of `md` whose strip() equals `hdr`, or None.
+
+    Candidates come from str.find, so only lines containing `hdr` are
+    inspected instead of stripping every line. The offset is a line start,
+    so splitting there keeps md.splitlines() boundaries intact.
+    """
+    pos = md.find(hdr)
+    while pos != -1:
+        start = pos
+        while start > 0 and md[start - 1].isspace() and md[start - 1] not in _LINE_SEPS:
+            start -= 1
+        if (start == 0 or md[start - 1] in _LINE_SEPS) and _LINE_REST_RE.match(md, pos + len(hdr)):
+            return start
+        pos = md.find(hdr, pos + 1)
+    return None
+
+
+def _section_end(lines: list[str], hdr: str) -> int:
+    """Index of the next '## ' header after lines[0] (the `hdr` line), or len(lines)."""
+    j = 1
+    while j < len(lines):
+        ln = lines[j]
+        # `in` is a cheap pre-check; most section lines are not headers.
+        if "## " in ln and ln.lstrip().startswith("## ") and ln.strip() != hdr:
+            break
+        j += 1
+    return j
+
 
 @dataclass
 class QueueItem:
@@ -79,24 +120,14 @@ def _split_sections(md: str) -> tuple[list[str], list[str], list[str]]:
 
     queue_lines includes the header line itself and content until next header.
     """
-    lines = md.splitlines(keepends=True)
-    idx = None
-    for i, ln in enumerate(lines):
-        if ln.strip() == QUEUE_HDR:
-            idx = i
-            break
-    if idx is None:
+    start = _find_header(md, QUEUE_HDR)
+    if start is None:
         raise ValueError(f"Missing {QUEUE_HDR} section")
 
-    # queue starts at idx, ends before next '## ' header (excluding DONE is handled later)
-    j = idx + 1
-    while j < len(lines):
-        s = lines[j].lstrip()
-        if s.startswith("## ") and lines[j].strip() != QUEUE_HDR:
-            break
-        j += 1
-
-    return lines[:idx], lines[idx:j], lines[j:]
+    # queue starts at the header, ends before next '## ' header (excluding DONE is handled later)
+    rest = md[start:].splitlines(keepends=True)
+    j = _section_end(rest, QUEUE_HDR)
+    return md[:start].splitlines(keepends=True), rest[:j], rest[j:]
 
 
 def _extract_done_block(md: str) -> tuple[str, str]:
@@ -105,23 +136,14 @@ def _extract_done_block(md: str) -> tuple[str, str]:
     done_block_text includes the DONE header and its following lines until next header.
     If DONE header missing, returns original md and empty done_block_text.
     """
-    lines = md.splitlines(keepends=True)
-    idx = None
-    for i, ln in enumerate(lines):
-        if ln.strip() == DONE_HDR:
-            idx = i
-            break
-    if idx is None:
+    start = _find_header(md, DONE_HDR)
+    if start is None:
         return md, ""
 
-    j = idx + 1
-    while j < len(lines):
-        if lines[j].lstrip().startswith("## ") and lines[j].strip() != DONE_HDR:
-            break
-        j += 1
-
-    done_block = "".join(lines[idx:j])
-    without = "".join(lines[:idx] + lines[j:])
+    rest = md[start:].splitlines(keepends=True)
+    j = _section_end(rest, DONE_HDR)
+    done_block = "".join(rest[:j])
+    without = md[:start] + "".join(rest[j:])
     return without, done_block
 
 
@@ -139,10 +161,11 @@ def _parse_queue_items(queue_block: list[str]) -> list[QueueItem]:
         body = m.group("body").strip()
 
         text_en = None
-        if "||" in body:
-            left, right = [x.strip() for x in body.split("||", 1)]
-            body = left
-            if right.lower().startswith("en:"):
+        left, sep, right = body.partition("||")  # one scan; splits on the first "||"
+        if sep:
+            body = left.strip()
+            right = right.strip()
+            if right[:3].lower() == "en:":
                 text_en = right[3:].strip() or None
 
         items.append(
@@ -159,18 +182,17 @@ def _parse_queue_items(queue_block: list[str]) -> list[QueueItem]:
 
 def _run_store(item: QueueItem, *, workspace: Path | None) -> dict[str, Any]:
     # openclaw-mem's installed console script may not exist in some uv setups
-    # (e.g., when the project isn't packaged). So we call the module directly
-    # using the current interpreter (expected: `uv run ... python ...`).
+    # (e.g., when the project isn't packaged), and a `python -m openclaw_mem`
+    # process per item pays interpreter start + package import every time.
+    # So we run the CLI entry point in-process with the same argv instead
+    # (expected: `uv run ... python ...`, which makes the package importable).
 
     # Map vault-friendly aliases to openclaw-mem categories.
     cat = item.category.strip().lower()
     if cat == "note":
         cat = "other"
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "openclaw_mem",
+    argv = [
         "store",
         item.text,
         "--category",
@@ -181,23 +203,23 @@ def _run_store(item: QueueItem, *, workspace: Path | None) -> dict[str, Any]:
     ]
 
     if workspace is not None:
-        cmd += ["--workspace", str(workspace)]
+        argv += ["--workspace", str(workspace)]
 
     if item.text_en:
-        cmd += ["--text-en", item.text_en]
+        argv += ["--text-en", item.text_en]
 
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    if p.returncode != 0:
-        raise RuntimeError(f"store failed ({p.returncode}): {p.stderr.strip() or p.stdout.strip()}")
+    returncode, stdout, stderr = _run_cli(argv)
+    if returncode != 0:
+        raise RuntimeError(f"store failed ({returncode}): {stderr.strip() or stdout.strip()}")
 
     # openclaw-mem prints warnings to stderr; JSON result should be on stdout.
-    stdout = (p.stdout or "").strip()
-    stderr = (p.stderr or "").strip()
+    stdout = stdout.strip()
+    stderr = stderr.strip()
     if not stdout:
         raise RuntimeError(f"store produced no stdout (expected JSON). stderr={stderr[:400]}")
 
     try:
-        return json.loads(stdout)
+        return loads(stdout)
     except Exception as e:
         # If stdout contains extra non-JSON lines, attempt to salvage the last JSON block.
         s = stdout
@@ -205,7 +227,7 @@ def _run_store(item: QueueItem, *, workspace: Path | None) -> dict[str, Any]:
         if start != -1:
             tail = s[start:]
             try:
-                return json.loads(tail)
+                return loads(tail)
             except Exception:
                 pass
         raise RuntimeError(
@@ -215,6 +237,29 @@ def _run_store(item: QueueItem, *, workspace: Path | None) -> dict[str, Any]:
         )
 
 
+def _run_cli(argv: list[str]) -> tuple[int, str, str]:
+    """Run `openclaw-mem <argv>` in this process; return (exit code, stdout, stderr)."""
+    from openclaw_mem.cli import main as cli_main
+
+    out, err = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = ["openclaw-mem", *argv]
+    code: Any = 0
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            cli_main()
+    except SystemExit as e:
+        code = e.code
+    finally:
+        sys.argv = saved_argv
+    if code is None:
+        code = 0
+    elif not isinstance(code, int):
+        err.write(f"{code}\n")
+        code = 1
+    return code, out.getvalue(), err.getvalue()
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--vault", required=True, help="Path to shared vault root")
@@ -300,15 +345,11 @@ def main() -> None:
     # If apply, rewrite markdown: remove processed items from Queue, append them under Done.
     if args.apply and done_lines:
         # Remove already-imported bullets from queue by exact raw match
-        kept_queue_lines: list[str] = [queue_block[0]]  # header
         imported_raw = {r["raw"] for r in results if r.get("ok")}
-        for ln in queue_block[1:]:
-            stripped = ln.strip()
-            if stripped in imported_raw:
-                continue
-            kept_queue_lines.append(ln)
+        kept_queue = [ln for ln in queue_block[1:] if ln.strip() not in imported_raw]
 
-        new_md = "".join(before + kept_queue_lines + after)
+        # One join over all parts, without concatenating the line lists first.
+        new_md = "".join([*before, queue_block[0], *kept_queue, *after])
 
         # Ensure DONE block exists; append if missing.
         if DONE_HDR not in new_md:
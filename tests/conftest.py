@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+
+import pytest
+
+from openclaw_mem import cli
+from openclaw_mem.core import db
+
+
+@pytest.fixture(autouse=True)
+def _isolated_default_workspace(tmp_path_factory, monkeypatch):
+    """Point the CLI's cwd fallback workspace at a scratch dir.
+
+    `store` appends daily notes under `<workspace>/memory/`; without this,
+    every run from the repo root would write into the checkout.
+    """
+    workspace = tmp_path_factory.mktemp("workspace")
+    (workspace / "memory").mkdir()
+    monkeypatch.setattr(cli, "DEFAULT_WORKSPACE", workspace)
+
+
+@pytest.fixture(scope="session")
+def _memory_schema_template():
+    """A fully migrated in-memory database, built once for the whole run."""
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    db._init_db(template)
+    db._migrate_new_database(template)
+    yield template, threading.Lock()
+    template.close()
+
+
+def _is_empty_memory_db(conn: sqlite3.Connection) -> bool:
+    main_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    return not main_file and conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone() is None
+
+
+@pytest.fixture(autouse=True)
+def _clone_memory_schema(_memory_schema_template, monkeypatch):
+    """Copy the template into new `_connect(":memory:")` databases.
+
+    Running the baseline DDL and every migration costs ~8ms per connection
+    and the suite opens hundreds; a backup() copy takes well under 1ms.
+    File databases still go through the real schema code.
+    """
+    template, lock = _memory_schema_template
+    init_db = db._init_db
+    migrate_new_database = db._migrate_new_database
+
+    def clone_or_init(conn):
+        if not _is_empty_memory_db(conn):
+            init_db(conn)
+            return
+        with lock:
+            template.backup(conn)
+        db._write_meta_stamp(conn)
+        conn.commit()
+
+    def migrate_unless_current(conn):
+        if int(conn.execute("PRAGMA user_version").fetchone()[0]) < db.CURRENT_DB_VERSION:
+            migrate_new_database(conn)
+
+    monkeypatch.setattr(db, "_init_db", clone_or_init)
+    monkeypatch.setattr(db, "_migrate_new_database", migrate_unless_current)
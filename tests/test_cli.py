@@ -11,7 +11,7 @@ from unittest.mock import patch
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
-from openclaw_mem.cli import _connect, _enable_wal_best_effort, _insert_observation, _summary_has_task_marker, _normalize_importance_scorer_value, _pack_graph_resolve_scope, build_parser, cmd_ingest, cmd_search, cmd_get, cmd_timeline, cmd_triage, cmd_store, cmd_hybrid, cmd_pack, cmd_status, cmd_doctor, cmd_profile, cmd_backend, cmd_graph_index, cmd_graph_pack, cmd_graph_preflight, cmd_graph_auto_status, cmd_graph_capture_git, cmd_graph_capture_md, cmd_graph_export, cmd_graph_synth, cmd_graph_lint, cmd_vsearch, main as cli_main
+from openclaw_mem.cli import _connect, _enable_wal_best_effort, _insert_observation, _summary_has_task_marker, _normalize_importance_scorer_value, _pack_graph_resolve_scope, _reachable_commands, build_parser, cmd_ingest, cmd_search, cmd_get, cmd_timeline, cmd_triage, cmd_store, cmd_hybrid, cmd_pack, cmd_status, cmd_doctor, cmd_profile, cmd_backend, cmd_graph_index, cmd_graph_pack, cmd_graph_preflight, cmd_graph_auto_status, cmd_graph_capture_git, cmd_graph_capture_md, cmd_graph_export, cmd_graph_synth, cmd_graph_lint, cmd_vsearch, main as cli_main
 from openclaw_mem.pack_artifacts import retrieve_artifact, PACK_RECEIPT_SCHEMA
 
 
@@ -630,6 +630,17 @@ class TestCliM0(unittest.TestCase):
         self.assertTrue(merged_before)
         self.assertTrue(merged_after)
 
+    def test_parser_built_for_one_command_matches_full_parser(self):
+        argv = ["--db", "memory.sqlite", "graph", "index", "hello"]
+        full = build_parser()
+        selective = build_parser(only=_reachable_commands(argv))
+
+        self.assertEqual(vars(selective.parse_args(argv)), vars(full.parse_args(argv)))
+        self.assertEqual(selective.format_help(), full.format_help())
+        self.assertEqual(sorted(selective._openclaw_top_subparsers.choices), sorted(full._openclaw_top_subparsers.choices))
+        self.assertIsNone(_reachable_commands(["status", "--help"]))
+        self.assertIsNone(_reachable_commands(["--json"]))
+
     def test_graph_parser_can_parse_subcommands(self):
         a = build_parser().parse_args(["graph", "index", "hello"])
         self.assertEqual(a.cmd, "graph")
@@ -1793,6 +1804,43 @@ class TestCliM0(unittest.TestCase):
 
         conn.close()
 
+    def test_timeline_previews_rows_and_includes_detail_on_request(self):
+        conn = _connect(":memory:")
+        for i in range(4):
+            _insert_observation(conn, {"kind": "note", "summary": f"row {i}", "tool_name": "exec", "detail": {"n": i}})
+        conn.commit()
+
+        args = type("Args", (), {"ids": [1, 4], "window": 1, "json": True})()
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            cmd_timeline(conn, args)
+        preview = json.loads(buf.getvalue())
+        self.assertEqual([r["id"] for r in preview], [1, 2, 3, 4])
+        self.assertTrue(all("detail_json" not in r for r in preview))
+        self.assertEqual(preview[0]["summary"], "row 0")
+
+        args = type("Args", (), {"ids": [2], "window": 0, "detail": True, "json": True})()
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            cmd_timeline(conn, args)
+        detailed = json.loads(buf.getvalue())
+        self.assertEqual(json.loads(detailed[0]["detail_json"])["n"], 1)
+        conn.close()
+
+    def test_get_text_output_renders_print_row_fields(self):
+        conn = _connect(":memory:")
+        _insert_observation(conn, {"kind": "note", "summary": "alpha", "tool_name": "exec", "detail": {"blob": "x" * 64}})
+        conn.commit()
+
+        args = type("Args", (), {"ids": [1], "json": False})()
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            cmd_get(conn, args)
+        line = buf.getvalue().strip()
+        self.assertTrue(line.startswith("#1 "))
+        self.assertTrue(line.endswith("[note] exec :: alpha"))
+        conn.close()
+
     def test_search_prefers_fresh_synthesis_cards_in_results(self):
         conn = _connect(":memory:")
         _insert_observation(conn, {"kind": "note", "summary": "alpha rollout note", "tool_name": "memory_store", "detail": {}})
@@ -1984,6 +2032,58 @@ class TestCliM0(unittest.TestCase):
 
         conn.close()
 
+    def test_triage_heartbeat_combines_observations_cron_and_tasks(self):
+        import tempfile
+        from datetime import datetime, timezone
+
+        conn = _connect(":memory:")
+        now = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        sample = "\n".join(
+            [
+                json.dumps({"ts": now, "kind": "tool", "tool_name": "exec", "summary": "Error: command failed", "detail": {}}),
+                json.dumps({"ts": now, "kind": "task", "tool_name": "memory_store", "summary": "TODO: renew cert", "detail": {"importance": 0.9}}),
+            ]
+        )
+        old_stdin = sys.stdin
+        try:
+            sys.stdin = io.StringIO(sample)
+            with redirect_stdout(io.StringIO()):
+                cmd_ingest(conn, type("Args", (), {"file": None, "json": True})())
+        finally:
+            sys.stdin = old_stdin
+
+        jobs = {"jobs": [{"id": "job-bad", "name": "Bad", "state": {"lastStatus": "error", "lastRunAtMs": 9999999999999}}]}
+        with tempfile.TemporaryDirectory() as td:
+            cron_path = os.path.join(td, "jobs.json")
+            with open(cron_path, "w", encoding="utf-8") as fh:
+                json.dump(jobs, fh)
+            args = type(
+                "Args",
+                (),
+                {
+                    "mode": "heartbeat",
+                    "since_minutes": 60,
+                    "limit": 10,
+                    "keywords": None,
+                    "cron_jobs_path": cron_path,
+                    "tasks_since_minutes": 1440,
+                    "importance_min": 0.7,
+                    "state_path": os.path.join(td, "state.json"),
+                    "json": True,
+                },
+            )()
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                with self.assertRaises(SystemExit) as cm:
+                    cmd_triage(conn, args)
+
+        self.assertEqual(cm.exception.code, 10)
+        out = json.loads(buf.getvalue())
+        self.assertEqual(out["observations"]["found_new"], 1)
+        self.assertEqual(out["cron"]["matches"][0]["id"], "job-bad")
+        self.assertEqual(out["tasks"]["matches"][0]["summary"], "TODO: renew cert")
+        conn.close()
+
     def test_triage_tasks_mode_dedupes_by_state(self):
         import tempfile
         from datetime import datetime, timezone
@@ -2053,6 +2153,81 @@ class TestCliM0(unittest.TestCase):
 
         conn.close()
 
+    def test_triage_tasks_parses_importance_forms_from_detail_json(self):
+        from datetime import datetime, timezone
+
+        from openclaw_mem.cli import _triage_tasks
+
+        conn = _connect(":memory:")
+        now = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        rows = [
+            ("TODO: numeric importance", json.dumps({"importance": 0.9})),
+            ("TODO: canonical importance", json.dumps({"importance": {"score": 0.85, "label": "must_remember"}})),
+            ("TODO: label-only importance", json.dumps({"importance": {"label": "high"}})),
+            ("TODO: string importance", json.dumps({"importance": "90%"})),
+            ("TODO: low importance", json.dumps({"importance": 0.1})),
+            ("TODO: malformed detail", "{not json"),
+        ]
+        for summary, detail_json in rows:
+            conn.execute(
+                "INSERT INTO observations (ts, kind, summary, tool_name, detail_json) VALUES (?, 'task', ?, 'memory_store', ?)",
+                (now, summary, detail_json),
+            )
+        conn.commit()
+
+        out = _triage_tasks(conn, since_ts="1970-01-01T00:00:00Z", importance_min=0.7, limit=10)
+        got = {item["summary"]: item["importance"] for item in out}
+        self.assertEqual(
+            got,
+            {
+                "TODO: numeric importance": 0.9,
+                "TODO: canonical importance": 0.85,
+                "TODO: label-only importance": 0.8,
+                "TODO: string importance": 0.9,
+            },
+        )
+        conn.close()
+
+    def test_triage_tasks_importance_matches_python_json_decoding(self):
+        from datetime import datetime, timezone
+
+        from openclaw_mem.cli import _triage_tasks
+
+        conn = _connect(":memory:")
+        now = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        rows = [
+            # JSON booleans are not scores; SQLite would otherwise surface them as 1/0.
+            ("TODO: boolean true importance", json.dumps({"importance": True})),
+            ("TODO: boolean false importance", json.dumps({"importance": False})),
+            # NaN/Infinity are accepted by Python's json but rejected by json_valid.
+            ("TODO: nan elsewhere", '{"importance": 0.9, "score": NaN}'),
+            ("TODO: infinity elsewhere", '{"importance": {"score": 0.75}, "ratio": Infinity}'),
+            # Repeated keys: json.loads keeps the last value, json_extract the first.
+            ("TODO: duplicate importance", '{"importance": 0.1, "importance": 0.9}'),
+            ("TODO: nested importance key", '{"importance": 0.6, "meta": {"importance": 0.2}}'),
+        ]
+        for summary, detail_json in rows:
+            conn.execute(
+                "INSERT INTO observations (ts, kind, summary, tool_name, detail_json) VALUES (?, 'task', ?, 'memory_store', ?)",
+                (now, summary, detail_json),
+            )
+        conn.commit()
+
+        out = _triage_tasks(conn, since_ts="1970-01-01T00:00:00Z", importance_min=0.0, limit=10)
+        got = {item["summary"]: item["importance"] for item in out}
+        self.assertEqual(
+            got,
+            {
+                "TODO: boolean true importance": 0.0,
+                "TODO: boolean false importance": 0.0,
+                "TODO: nan elsewhere": 0.9,
+                "TODO: infinity elsewhere": 0.75,
+                "TODO: duplicate importance": 0.9,
+                "TODO: nested importance key": 0.6,
+            },
+        )
+        conn.close()
+
     def test_triage_tasks_mode_no_dedupe_does_not_write_state(self):
         import tempfile
         from datetime import datetime, timezone
@@ -3741,6 +3916,35 @@ class TestCliM0(unittest.TestCase):
 
         conn.close()
 
+    def test_triage_cron_errors_orders_most_recent_failures_within_limit(self):
+        import tempfile
+
+        from openclaw_mem.cli import _triage_cron_errors
+
+        jobs = {
+            "jobs": [
+                "not-a-job",
+                {"id": "healthy", "name": "Healthy", "state": {"lastStatus": "OK", "lastRunAtMs": 5000}},
+                {"id": "no-state", "name": "No state"},
+                {"id": "stale", "name": "Stale", "state": {"lastStatus": "error", "lastRunAtMs": 10}},
+                {"id": "older", "name": "B older", "state": {"lastStatus": "error", "lastRunAtMs": 2000}},
+                {"id": "tie", "name": "A tie", "state": {"lastStatus": "timeout", "lastRunAtMs": "3000"}},
+                {"id": "newest", "name": "C newest", "state": {"lastStatus": "error", "lastRunAtMs": 3000}},
+                {"id": "unknown-run", "name": "Unknown run", "state": {"lastStatus": "error"}},
+            ]
+        }
+        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", suffix=".json", delete=False) as tmp:
+            json.dump(jobs, tmp)
+            tmp_path = tmp.name
+
+        got = _triage_cron_errors(since_ms=1000, cron_jobs_path=tmp_path, limit=3)
+        self.assertEqual([job["id"] for job in got], ["tie", "newest", "older"])
+        self.assertEqual(got[0]["lastRunAtMs"], 3000)
+
+        everything = _triage_cron_errors(since_ms=1000, cron_jobs_path=tmp_path, limit=10)
+        self.assertEqual([job["id"] for job in everything], ["tie", "newest", "older", "unknown-run"])
+        os.unlink(tmp_path)
+
     def test_store_persists_dual_language_fields(self):
         conn = _connect(":memory:")
 
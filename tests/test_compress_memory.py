@@ -1,6 +1,11 @@
+import json
+import os
 import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest import mock
 
 # Import from parent directory
 import sys
@@ -8,9 +13,13 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
 
 from compress_memory import (
     CompressError,
+    OpenAIClient,
     validate_date,
+    date_range,
+    read_dates_file,
     atomic_append,
     compress_daily_note,
+    compress_daily_notes,
 )
 
 
@@ -28,6 +37,103 @@ class MockOpenAIClient:
         return self.response
 
 
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.server.peers.add(self.client_address)
+        self.server.posts += 1
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if payload["model"] == "broken":
+            status, body = 500, b'{"error": "boom"}'
+        elif payload["model"] == "flaky" and self.server.posts <= 2:
+            status, body = 503, b'{"error": "overloaded"}'
+        else:
+            status = 200
+            body = json.dumps({"choices": [{"message": {"content": f" summary for {payload['model']} "}}]}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestOpenAIClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+        self.server.peers = set()
+        self.server.posts = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        env = {k: v for k, v in os.environ.items() if not k.lower().endswith("_proxy")}
+        patcher = mock.patch.dict(os.environ, env, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        backoff = mock.patch.object(OpenAIClient, "_BACKOFF_SECONDS", 0.0)
+        backoff.start()
+        self.addCleanup(backoff.stop)
+        self.client = OpenAIClient("sk-test", base_url=f"http://127.0.0.1:{self.server.server_port}/v1/")
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_one_connection_across_calls(self):
+        self.assertEqual(self.client.complete("a", "m1", 10, 0.0), "summary for m1")
+        self.assertEqual(self.client.complete("b", "m2", 10, 0.0), "summary for m2")
+        self.assertEqual(len(self.server.peers), 1)
+
+    def test_response_cache_skips_repeat_calls_and_honors_force_refresh(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "openai"
+            base_url = f"http://127.0.0.1:{self.server.server_port}/v1"
+            cached = OpenAIClient("sk-test", base_url=base_url, cache_dir=cache_dir)
+            self.addCleanup(cached.close)
+            self.assertEqual(cached.complete("a", "m1", 10, 0.0), "summary for m1")
+            self.assertEqual(cached.complete("a", "m1", 10, 0.0), "summary for m1")
+            self.assertEqual(self.server.posts, 1)
+
+            # A different model is a different key.
+            cached.complete("a", "m2", 10, 0.0)
+            self.assertEqual(self.server.posts, 2)
+
+            refresh = OpenAIClient("sk-test", base_url=base_url, cache_dir=cache_dir, force_refresh=True)
+            self.addCleanup(refresh.close)
+            refresh.complete("a", "m1", 10, 0.0)
+            self.assertEqual(self.server.posts, 3)
+
+            with self.assertRaises(CompressError):
+                cached.complete("a", "broken", 10, 0.0)
+            self.assertEqual(len(list(cache_dir.glob("*.json"))), 2)
+
+    def test_main_cache_env_accepts_common_truthy_values(self):
+        import compress_memory
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir)
+            for value, enabled in [("1", True), (" TRUE ", True), ("yes", True), ("On", True), ("0", False), ("", False)]:
+                env = {"OPENAI_API_KEY": "sk-test", "OPENCLAW_MEM_WORKSPACE": tmpdir, "OPENCLAW_MEM_CACHE": value}
+                with mock.patch.dict(os.environ, env), \
+                        mock.patch.object(sys, "argv", ["compress_memory.py", "2026-02-05", "--json"]), \
+                        mock.patch.object(compress_memory, "OpenAIClient") as client_cls, \
+                        mock.patch("builtins.print"):
+                    compress_memory.main()
+                expected = workspace / ".cache" / "openai" if enabled else None
+                self.assertEqual(client_cls.call_args.kwargs["cache_dir"], expected, value)
+
+    def test_http_error_status_raises_compress_error(self):
+        with self.assertRaisesRegex(CompressError, r"OpenAI API error \(500\): .*boom"):
+            self.client.complete("a", "broken", 10, 0.0)
+        self.assertEqual(self.server.posts, 1 + OpenAIClient._RETRIES)
+
+    def test_transient_status_is_retried(self):
+        self.assertEqual(self.client.complete("a", "flaky", 10, 0.0), "summary for flaky")
+        self.assertEqual(self.server.posts, 3)
+
+
 class TestValidateDate(unittest.TestCase):
     def test_valid_date(self):
         self.assertEqual(validate_date("2026-02-05"), "2026-02-05")
@@ -42,6 +148,29 @@ class TestValidateDate(unittest.TestCase):
             validate_date("2026-13-01")  # invalid month
 
 
+class TestDateSources(unittest.TestCase):
+    def test_date_range_is_inclusive_and_crosses_months(self):
+        self.assertEqual(date_range("2026-02-27", "2026-03-01"), ["2026-02-27", "2026-02-28", "2026-03-01"])
+        self.assertEqual(date_range("2026-02-05", "2026-02-05"), ["2026-02-05"])
+
+    def test_date_range_rejects_reversed_or_invalid_bounds(self):
+        with self.assertRaises(CompressError):
+            date_range("2026-02-05", "2026-02-04")
+        with self.assertRaises(CompressError):
+            date_range("2026-02-05", "soon")
+
+    def test_read_dates_file_skips_blanks_and_comments(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "dates.txt"
+            path.write_text("# backfill\n2026-02-01\n\n  2026-02-03  # retry\n")
+            self.assertEqual(read_dates_file(path), ["2026-02-01", "2026-02-03"])
+            path.write_text("2026-02-01\n02/03/2026\n")
+            with self.assertRaises(CompressError):
+                read_dates_file(path)
+            with self.assertRaises(CompressError):
+                read_dates_file(Path(tmpdir) / "missing.txt")
+
+
 class TestAtomicAppend(unittest.TestCase):
     def test_append_to_new_file(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -177,6 +306,121 @@ class TestCompressDailyNote(unittest.TestCase):
         self.assertTrue(result["skipped"])
         self.assertIn("already appears", result["reason"])
 
+    def test_empty_memory_file_is_not_treated_as_summarized(self):
+        daily_file = self.memory_dir / "2026-02-05.md"
+        daily_file.write_text("Content")
+        self.memory_file.write_text("")
+
+        result = compress_daily_note(
+            date="2026-02-05",
+            memory_dir=self.memory_dir,
+            memory_file=self.memory_file,
+            prompt_file=self.prompt_file,
+            client=MockOpenAIClient("Fresh summary"),
+            model="gpt-4.1",
+            max_tokens=700,
+            temperature=0.2,
+        )
+
+        self.assertTrue(result["appended"])
+        self.assertIn("## 2026-02-05 Summary", self.memory_file.read_text())
+
+    def test_prompt_normalizes_crlf_and_skips_unicode_blank_note(self):
+        daily_file = self.memory_dir / "2026-02-05.md"
+        daily_file.write_bytes("- déjà vu\r\n- next\r\n".encode("utf-8"))
+        client = MockOpenAIClient("Summary")
+
+        compress_daily_note(
+            date="2026-02-05",
+            memory_dir=self.memory_dir,
+            memory_file=self.memory_file,
+            prompt_file=self.prompt_file,
+            client=client,
+            model="gpt-4.1",
+            max_tokens=700,
+            temperature=0.2,
+            dry_run=True,
+        )
+
+        prompt = client.calls[0]["prompt"]
+        self.assertTrue(prompt.startswith("Compress this:\n"))
+        self.assertTrue(prompt.endswith("- déjà vu\n- next\n"))
+        self.assertNotIn("\r", prompt)
+
+        daily_file.write_text("\u3000\u00a0\n", encoding="utf-8")
+        result = compress_daily_note(
+            date="2026-02-05",
+            memory_dir=self.memory_dir,
+            memory_file=self.memory_file,
+            prompt_file=self.prompt_file,
+            client=client,
+            model="gpt-4.1",
+            max_tokens=700,
+            temperature=0.2,
+        )
+        self.assertTrue(result["skipped"])
+        self.assertEqual(result["reason"], "Daily note is empty")
+
+    def test_compress_several_dates_appends_in_date_order(self):
+        for day in ("01", "02", "03"):
+            (self.memory_dir / f"2026-02-{day}.md").write_text(f"note {day}")
+        self.memory_file.write_text("## 2026-02-02 Summary\nold\n")
+
+        class DateEchoClient:
+            def complete(self, prompt, model, max_tokens, temperature):
+                if "note 03" in prompt:
+                    raise CompressError("rate limited")
+                return "summary of " + prompt.rsplit("note ", 1)[1]
+
+        results = compress_daily_notes(
+            ["2026-02-01", "2026-02-04", "2026-02-02", "2026-02-03", "2026-02-01"],
+            memory_dir=self.memory_dir,
+            memory_file=self.memory_file,
+            prompt_file=self.prompt_file,
+            client_factory=DateEchoClient,
+            model="gpt-4.1",
+            max_tokens=700,
+            temperature=0.2,
+            jobs=3,
+        )
+
+        self.assertEqual([r["date"] for r in results], ["2026-02-01", "2026-02-04", "2026-02-02", "2026-02-03"])
+        self.assertTrue(results[0]["appended"])
+        self.assertIn("No daily note", results[1]["reason"])
+        self.assertIn("already appears", results[2]["reason"])
+        self.assertEqual(results[3], {"ok": False, "date": "2026-02-03", "error": "rate limited"})
+        content = self.memory_file.read_text()
+        self.assertEqual(content.count("## 2026-02-01 Summary"), 1)
+        self.assertIn("summary of 01", content)
+        self.assertNotIn("2026-02-03 Summary", content)
+
+    def test_compress_several_dates_rewrites_memory_file_once(self):
+        for day in ("03", "01", "02"):
+            (self.memory_dir / f"2026-03-{day}.md").write_text(f"note {day}")
+        self.memory_file.write_text("# Memory\n")
+
+        class DateEchoClient:
+            def complete(self, prompt, model, max_tokens, temperature):
+                return "summary of " + prompt.rsplit("note ", 1)[1]
+
+        with mock.patch("compress_memory.atomic_append", wraps=atomic_append) as append:
+            compress_daily_notes(
+                ["2026-03-03", "2026-03-01", "2026-03-02"],
+                memory_dir=self.memory_dir,
+                memory_file=self.memory_file,
+                prompt_file=self.prompt_file,
+                client_factory=DateEchoClient,
+                model="gpt-4.1",
+                max_tokens=700,
+                temperature=0.2,
+                jobs=3,
+            )
+
+        self.assertEqual(append.call_count, 1)
+        content = self.memory_file.read_text()
+        positions = [content.index(f"2026-03-{day} Summary") for day in ("03", "01", "02")]
+        self.assertEqual(positions, sorted(positions))
+
     def test_dry_run_mode(self):
         daily_file = self.memory_dir / "2026-02-05.md"
         daily_file.write_text("Content")
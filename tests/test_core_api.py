@@ -167,6 +167,87 @@ def test_core_store_returns_warnings_without_printing(tmp_path: Path, capsys) ->
         conn.close()
 
 
+def test_core_store_appends_daily_note_entries(tmp_path: Path) -> None:
+    conn = connect(":memory:")
+    try:
+        receipts = [
+            store_memory(conn, text=text, category="fact", importance=0.8, model="unused", memory_dir=tmp_path)[0]
+            for text in ("first durable note", "second durable note")
+        ]
+
+        md_file = Path(receipts[0]["markdownPath"])
+        assert receipts[1]["markdownPath"] == str(md_file)
+        lines = md_file.read_text(encoding="utf-8").splitlines()
+        assert lines == [
+            "- [FACT] first durable note (importance: 0.80, must_remember)",
+            "- [FACT] second durable note (importance: 0.80, must_remember)",
+        ]
+        assert not list(tmp_path.glob(".tmp_*"))
+    finally:
+        conn.close()
+
+
+class _FixedEmbeddingProvider:
+    provider_name = "fixture"
+    model_id = "fixture-model"
+
+    def embed(self, texts, model=None):
+        return [[3.0, 4.0] for _ in texts]
+
+
+def test_core_store_writes_both_embedding_lanes(tmp_path: Path) -> None:
+    from openclaw_mem.vector import unpack_f32
+
+    conn = connect(":memory:")
+    try:
+        receipt, warnings = store_memory(
+            conn,
+            text="雙語記憶",
+            text_en="bilingual memory",
+            category="fact",
+            importance=0.8,
+            model="fixture-model",
+            embedding_provider=_FixedEmbeddingProvider(),
+        )
+
+        assert receipt["embedded"] is True
+        assert warnings == []
+        for table in ("observation_embeddings", "observation_embeddings_en"):
+            row = conn.execute(
+                f"SELECT model, dim, vector, norm FROM {table} WHERE observation_id = ?",
+                (receipt["id"],),
+            ).fetchone()
+            assert (row["model"], row["dim"], row["norm"]) == ("fixture-model", 2, 5.0)
+            assert unpack_f32(row["vector"]) == [3.0, 4.0]
+    finally:
+        conn.close()
+
+
+def test_core_harvest_embeds_new_rows_in_batches(tmp_path: Path) -> None:
+    conn = connect(":memory:")
+    source = tmp_path / "observations.jsonl"
+    source.write_text(
+        "\n".join(json.dumps({"kind": "fact", "summary": f"embed me {i}"}) for i in range(3)) + "\n",
+        encoding="utf-8",
+    )
+    try:
+        receipt, _warnings = harvest_observations(
+            conn,
+            source=source,
+            version="test",
+            update_index=False,
+            embed=True,
+            api_key="test-key",
+            model="fixture-model",
+            embedding_client_factory=lambda **_kwargs: _FixedEmbeddingProvider(),
+        )
+
+        assert receipt["embedded"] == 3
+        assert conn.execute("SELECT COUNT(*) FROM observation_embeddings WHERE norm = 5.0").fetchone()[0] == 3
+    finally:
+        conn.close()
+
+
 def test_core_harvest_recovers_processing_file_without_output(tmp_path: Path, capsys) -> None:
     conn = connect(":memory:")
     source = tmp_path / "observations.jsonl"
@@ -196,6 +277,100 @@ def test_core_harvest_recovers_processing_file_without_output(tmp_path: Path, ca
         conn.close()
 
 
+def test_core_harvest_batches_rows_and_keeps_fts_lanes_in_sync(tmp_path: Path, monkeypatch) -> None:
+    from openclaw_mem.core import records
+
+    monkeypatch.setattr(records, "_INSERT_BATCH_SIZE", 2)
+    conn = connect(":memory:")
+    source = tmp_path / "observations.jsonl"
+    lines = [json.dumps({"kind": "fact", "summary": f"batched harvest 記憶批次 {i}"}) for i in range(5)]
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    try:
+        receipt, _warnings = harvest_observations(conn, source=source, version="test", update_index=False)
+
+        assert receipt["ingested"] == 5
+        ids = [row[0] for row in conn.execute("SELECT id FROM observations ORDER BY id")]
+        assert len(ids) == 5
+        fts_ids = [row[0] for row in conn.execute(
+            "SELECT rowid FROM observations_fts WHERE observations_fts MATCH 'batched' ORDER BY rowid"
+        )]
+        tri_ids = [row[0] for row in conn.execute(
+            "SELECT rowid FROM observations_fts_tri WHERE observations_fts_tri MATCH '\"記憶批次\"' ORDER BY rowid"
+        )]
+        assert fts_ids == ids
+        assert tri_ids == ids
+    finally:
+        conn.close()
+
+
+def test_core_ingest_batches_report_ids_of_inserted_rows(monkeypatch) -> None:
+    from openclaw_mem.core import records
+
+    monkeypatch.setattr(records, "_INSERT_BATCH_SIZE", 2)
+    conn = connect(":memory:")
+    try:
+        ingest_observations(conn, [{"kind": "fact", "summary": "seed"}, {"kind": "fact", "summary": "gone"}])
+        conn.execute("DELETE FROM observations WHERE summary = 'gone'")
+        conn.commit()
+
+        receipt = ingest_observations(
+            conn,
+            [{"kind": "fact", "summary": f"ingest batch row {i}"} for i in range(3)],
+            importance_scorer="off",
+        )
+
+        assert receipt["inserted"] == 3
+        rows = conn.execute("SELECT id, summary FROM observations WHERE id > 1 ORDER BY id").fetchall()
+        assert [row[0] for row in rows] == receipt["ids"] == [3, 4, 5]
+        assert [row[1] for row in rows] == [f"ingest batch row {i}" for i in range(3)]
+        fts_ids = [row[0] for row in conn.execute(
+            "SELECT rowid FROM observations_fts WHERE observations_fts MATCH 'ingest' ORDER BY rowid"
+        )]
+        assert fts_ids == receipt["ids"]
+    finally:
+        conn.close()
+
+
+def test_core_bulk_ingest_rebuilds_fts_lanes_once() -> None:
+    conn = connect(":memory:")
+    try:
+        receipt = ingest_observations(
+            conn,
+            [{"kind": "fact", "summary": f"bulk load 記憶批次 {i}"} for i in range(3)],
+            importance_scorer="off",
+            bulk=True,
+        )
+
+        assert receipt["inserted"] == 3
+        assert receipt["fts_rebuilt"] is True
+        fts_ids = [row[0] for row in conn.execute(
+            "SELECT rowid FROM observations_fts WHERE observations_fts MATCH 'bulk' ORDER BY rowid"
+        )]
+        tri_ids = [row[0] for row in conn.execute(
+            "SELECT rowid FROM observations_fts_tri WHERE observations_fts_tri MATCH '\"記憶批次\"' ORDER BY rowid"
+        )]
+        assert fts_ids == tri_ids == receipt["ids"]
+    finally:
+        conn.close()
+
+
+def test_core_bulk_ingest_truncates_wal_after_load(tmp_path: Path) -> None:
+    db = tmp_path / "bulk.sqlite"
+    conn = connect(str(db))
+    try:
+        ingest_observations(
+            conn,
+            [{"kind": "fact", "summary": f"bulk wal {i}"} for i in range(50)],
+            importance_scorer="off",
+            bulk=True,
+        )
+
+        assert conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == 50
+        assert Path(f"{db}-wal").stat().st_size == 0
+    finally:
+        conn.close()
+
+
 def test_core_harvest_empty_source_receipt(tmp_path: Path) -> None:
     conn = connect(":memory:")
     try:
@@ -79,6 +79,32 @@ third paragraph
         self.assertIn("title-alpha:001", ids1)
         self.assertIn("title-alpha~2:001", ids1)
 
+    def test_chunking_packs_paragraphs_of_oversized_sections(self):
+        para = "word " * 30
+        text = "\n".join(
+            [
+                "## Big",
+                para,
+                "   ",
+                para,
+                "",
+                "",
+                para,
+                "```",
+                "# not a heading",
+                "```",
+                "",
+                "x" * 450,
+            ]
+        )
+
+        chunks = chunk_markdown(text, default_title="test", max_chars=300)
+
+        self.assertEqual([c.chunk_id for c in chunks], ["big:001", "big:002", "big:003", "big:004"])
+        self.assertEqual(chunks[0].text, f"{para.strip()}\n\n{para.strip()}")
+        self.assertEqual(chunks[1].text, f"{para}\n```\n# not a heading\n```")
+        self.assertEqual([c.text for c in chunks[2:]], ["x" * 300, "x" * 150])
+
     def test_rrf_fusion_is_deterministic(self):
         # Equal final RRF score for IDs 1 and 2; deterministic tie-break should be id asc.
         fts_ids = [2, 1]
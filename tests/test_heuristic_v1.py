@@ -86,5 +86,26 @@ class TestHeuristicV1(unittest.TestCase):
         self.assertEqual(r_tool_prefixed.label, "nice_to_have")
 
 
+    def test_heuristic_identifier_scan_keeps_env_var_case_sensitive(self):
+        reason = "Contains stable identifiers useful for future lookup/automation."
+        for summary in (
+            "see HTTPS://example.com/run",
+            "job 123E4567-E89B-12D3-A456-426614174000",
+            "tune agents.defaults.memory",
+            "export OPENCLAW_MEM_DB",
+        ):
+            with self.subTest(summary=summary):
+                self.assertIn(reason, grade_observation({"kind": "note", "summary": summary}).reasons)
+
+        self.assertNotIn(reason, grade_observation({"kind": "note", "summary": "export openclaw_mem_db"}).reasons)
+
+    def test_heuristic_empty_text_keeps_baseline_or_task_kind_score(self):
+        r_empty = grade_observation({"kind": "note", "summary": "   "})
+        self.assertEqual((r_empty.score, r_empty.rationale), (0.30, "Heuristic grade."))
+
+        r_task = grade_observation({"kind": " Task ", "summary": ""})
+        self.assertEqual(r_task.score, 0.50)
+        self.assertEqual(r_task.reasons, ("Action item that remains relevant until done.",))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from openclaw_mem.core import jsonio
+
+
+def test_loads_accepts_utf8_bytes_and_text() -> None:
+    payload = {"jobs": [{"name": "每日摘要", "state": {"lastStatus": "error"}}]}
+    raw = json.dumps(payload, ensure_ascii=False)
+    assert jsonio.loads(raw.encode("utf-8")) == payload
+    assert jsonio.loads(raw) == payload
+
+
+def test_loads_keeps_stdlib_leniency_for_non_standard_literals() -> None:
+    value = jsonio.loads(b'{"score": NaN}')
+    assert math.isnan(value["score"])
+
+
+def test_loads_raises_stdlib_decode_error_for_invalid_json() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads(b"{not json")
@@ -73,3 +73,25 @@ def test_db_info_reports_migration_application(tmp_path: Path, capsys) -> None:
             "applied": True,
         },
     ]
+
+
+def test_memory_databases_copy_the_current_schema_independently(tmp_path: Path) -> None:
+    file_conn = cli._connect(str(tmp_path / "schema.sqlite"))
+    first = cli._connect(":memory:")
+    second = cli._connect(":memory:")
+    try:
+        schema_sql = "SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY type, name"
+        assert first.execute(schema_sql).fetchall() == file_conn.execute(schema_sql).fetchall()
+        assert first.execute("PRAGMA user_version").fetchone()[0] == cli.CURRENT_DB_VERSION
+        assert first.execute("SELECT value FROM meta WHERE key = 'last_writer_version'").fetchone()[0]
+
+        first.execute(
+            "INSERT INTO observations(ts, kind, tool_name, summary, detail_json) VALUES (?, ?, ?, ?, ?)",
+            ("2026-01-01T00:00:00Z", "tool", "exec", "only in first", "{}"),
+        )
+        first.commit()
+        assert second.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == 0
+    finally:
+        first.close()
+        second.close()
+        file_conn.close()
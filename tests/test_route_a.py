@@ -2,7 +2,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from openclaw_mem.cli import _connect, _build_index, _extract_obs_ids, _rank_obs_ids_from_snippet, _cjk_terms, _search_cjk_fallback, _tokenize_query
+from openclaw_mem.cli import _connect, _build_index, _extract_obs_ids, _iter_obs_lines, _rank_obs_ids_from_snippet, _cjk_terms, _search_cjk_fallback, _tokenize_query
 
 
 class TestRouteAIndex(unittest.TestCase):
@@ -16,6 +16,38 @@ class TestRouteAIndex(unittest.TestCase):
         self.assertTrue(ranked)
         self.assertEqual(ranked[0][0], 5)
 
+    def test_rank_obs_ids_from_snippet_uses_first_ref_per_line(self):
+        snippet = "header without refs\r\n- obs#3 alpha see obs#9\r\n- obs#12b not a ref\n- obs#4 beta"
+        ranked = _rank_obs_ids_from_snippet(snippet, query="alpha beta")
+        self.assertEqual(sorted(oid for oid, _ in ranked), [3, 4])
+
+    def test_rank_obs_ids_from_snippet_splits_like_splitlines(self):
+        seps = ["\n", "\r", "\r\n", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029"]
+        snippet = "".join(f"- obs#{i} alpha{sep}" for i, sep in enumerate(seps, start=1))
+        ranked = _rank_obs_ids_from_snippet(snippet, query="alpha")
+        self.assertEqual(ranked, [(i, 1.0) for i in range(1, len(seps) + 1)])
+
+    def test_iter_obs_lines_requires_word_boundaries_around_ref(self):
+        snippet = "xobs#1 then obs#2_ then obs#3 kept\n#obs#44\rtail obs#5\nplain text\nobs#"
+        self.assertEqual(
+            list(_iter_obs_lines(snippet)),
+            [(3, "xobs#1 then obs#2_ then obs#3 kept"), (44, "#obs#44"), (5, "tail obs#5")],
+        )
+
+    def test_rank_obs_ids_from_snippet_accepts_precomputed_query_terms(self):
+        snippet = "- obs#1 tool :: alpha\n- obs#5 tool :: Harvest test\n"
+        query = "Harvest OBS#5"
+        expected = _rank_obs_ids_from_snippet(snippet, query=query, base_score=0.5)
+        ranked = _rank_obs_ids_from_snippet(
+            snippet,
+            query=query,
+            base_score=0.5,
+            tokens=_tokenize_query(query),
+            query_lower=query.lower(),
+        )
+        self.assertEqual(ranked, expected)
+        self.assertEqual(ranked[0][0], 5)
+
     def test_tokenize_query_keeps_obs_id_and_filters_short_tokens(self):
         tokens = _tokenize_query("Need obs#5 status + api timeout aa a b")
         self.assertIn("obs#5", tokens)
@@ -23,6 +55,43 @@ class TestRouteAIndex(unittest.TestCase):
         self.assertNotIn("aa", tokens)
         self.assertNotIn("a", tokens)
 
+    def test_cmd_semantic_resolves_only_top_ranked_ids_across_snippets(self):
+        import io
+        import json
+        from contextlib import redirect_stdout
+        from unittest.mock import patch
+
+        from openclaw_mem.cli import cmd_semantic
+
+        conn = _connect(":memory:")
+        for summary in ("alpha deploy", "beta deploy", "alpha beta deploy"):
+            conn.execute(
+                "INSERT INTO observations (ts, kind, summary, tool_name, detail_json) VALUES (?,?,?,?,?)",
+                ("2026-02-06T00:00:00Z", "note", summary, "memory_store", "{}"),
+            )
+        conn.commit()
+
+        results = {
+            "details": {
+                "results": [
+                    {"snippet": "- obs#1 alpha deploy\n- obs#2 beta deploy", "score": 0.1},
+                    {"snippet": "- obs#3 alpha beta deploy\n- obs#1 alpha deploy", "score": 0.4},
+                ]
+            }
+        }
+        args = type(
+            "Args",
+            (),
+            {"query": "alpha beta", "max_results": 8, "min_score": 0.0, "session_key": "main", "limit": 2, "raw_limit": 0, "json": True},
+        )()
+        buf = io.StringIO()
+        with patch("openclaw_mem.cli._gateway_tools_invoke", return_value=results), redirect_stdout(buf):
+            cmd_semantic(conn, args)
+        out = json.loads(buf.getvalue())
+        self.assertEqual(out["ids"], [3, 1])
+        self.assertEqual([m["id"] for m in out["matches"]], [3, 1])
+        conn.close()
+
     def test_cjk_terms_extracts_full_run_and_bigrams(self):
         terms = _cjk_terms("測試測試", max_terms=16)
         self.assertGreaterEqual(len(terms), 3)
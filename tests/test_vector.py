@@ -1,8 +1,9 @@
 import math
 import time
 import unittest
+from array import array
 
-from openclaw_mem.vector import dot, pack_f32, unpack_f32, l2_norm, cosine_similarity, rank_cosine, rank_rrf
+from openclaw_mem.vector import dot, pack_f32, pack_f32_with_norm, unpack_f32, l2_norm, cosine_similarity, rank_cosine, rank_rrf
 
 
 def _rank_cosine_full_sort_baseline(*, query_vec, items, limit=20):
@@ -44,10 +45,28 @@ class TestVectorUtils(unittest.TestCase):
         for a, b in zip(vec, out):
             self.assertAlmostEqual(a, b, places=5)
 
+    def test_pack_f32_copies_float32_buffers_and_converts_others(self):
+        vec = [0.1, 0.2, -0.3, 4.0]
+        expected = pack_f32(vec)
+        self.assertEqual(pack_f32(array("f", vec)), expected)
+        self.assertEqual(pack_f32(array("d", vec)), expected)
+        self.assertEqual(pack_f32(iter(vec)), expected)
+
     def test_norm(self):
         self.assertAlmostEqual(l2_norm([3.0, 4.0]), 5.0)
         self.assertEqual(l2_norm([0.0, 0.0]), 0.0)
 
+    def test_pack_f32_with_norm_matches_separate_helpers(self):
+        vec = [0.1, -0.25, 3.0, 4.0, 1e-3]
+        blob, norm = pack_f32_with_norm(vec)
+        self.assertEqual(blob, pack_f32(vec))
+        # Stored and query norms come from the same routine, bit for bit.
+        self.assertEqual(norm, l2_norm(vec))
+        self.assertEqual(norm, l2_norm(x for x in vec))
+        blob_gen, norm_gen = pack_f32_with_norm(x for x in vec)
+        self.assertEqual((blob_gen, norm_gen), (blob, norm))
+        self.assertEqual(pack_f32_with_norm([]), (b"", 0.0))
+
     def test_cosine_similarity(self):
         self.assertAlmostEqual(cosine_similarity([1, 0], [1, 0]), 1.0)
         self.assertAlmostEqual(cosine_similarity([1, 0], [0, 1]), 0.0)